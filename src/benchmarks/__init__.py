@@ -0,0 +1,6 @@
+"""!
+    @file __init__.py
+
+    @brief Benchmarks of the calculator math library, run from the src directory with python -m benchmarks.<name>
+
+"""
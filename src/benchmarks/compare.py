@@ -0,0 +1,63 @@
+"""!
+    @file compare.py
+
+    @brief Comparison of two benchmark results, slower cases are reported as regressions
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.compare BASE.json NEW.json [-t PERCENT]
+    The exit status is 1 if any case is slower by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+
+
+def compare(base: dict, new: dict, threshold: float) -> list:
+    """!
+        @brief Function for comparing the best times of two benchmark results
+        @param base Results of the base run
+        @param new Results of the new run
+        @param threshold Allowed slowdown in percent
+        @return List of (name, base time, new time, change in percent, regression flag)
+    """
+
+    rows = []
+    for name, result in new["results"].items():
+        if name not in base["results"]:
+            continue
+        before = base["results"][name]["best"]
+        after = result["best"]
+        change = (after - before) / before * 100
+        rows.append((name, before, after, change, change > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark results")
+    parser.add_argument("base", help="JSON results of the base run")
+    parser.add_argument("new", help="JSON results of the new run")
+    parser.add_argument("-t", "--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    args = parser.parse_args()
+
+    with open(args.base) as file:
+        base = json.load(file)
+    with open(args.new) as file:
+        new = json.load(file)
+
+    rows = compare(base, new, args.threshold)
+    print("{:<32} {:>12} {:>12} {:>9}".format("case", "base [us]", "new [us]", "change"))
+    for name, before, after, change, regression in rows:
+        print("{:<32} {:>12.3f} {:>12.3f} {:>+8.1f}% {}".format(
+            name, before * 1e6, after * 1e6, change, "REGRESSION" if regression else ""))
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print("{} case(s) slower by more than {}%".format(len(regressions), args.threshold))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
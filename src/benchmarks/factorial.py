@@ -0,0 +1,59 @@
+"""!
+    @file factorial.py
+
+    @brief Benchmark of Advanced.factorial against the multiplication loop it replaced
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.factorial [--sizes 10,100,1000,10000,100000]
+    The first call of the table path fills the cache, the repeated call is
+    a lookup for numbers up to advanced.FACTORIAL_CACHE_LIMIT.
+"""
+
+import argparse
+import time
+
+from calculator.calclib import advanced
+
+
+def loop_factorial(x: int) -> int:
+    """!
+        @brief The original factorial, product of 1..x in a Python loop
+        @param x Operand
+        @return x!
+    """
+
+    result = 1
+    for num in range(1, x + 1):
+        result = result * num
+    return result
+
+
+def measure(function, *args):
+    """!
+        @brief Function for measuring a single call
+        @return Time of the call in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare factorial implementations")
+    parser.add_argument("--sizes", default="10,100,1000,10000,100000", help="comma separated operands")
+    args = parser.parse_args()
+
+    library = advanced.Advanced()
+    print("{:>8} {:>12} {:>12} {:>12} {:>9}".format("n", "loop [s]", "first [s]", "repeated [s]", "speedup"))
+    for n in (int(size) for size in args.sizes.split(",")):
+        loop = measure(loop_factorial, n)
+        first = measure(library.factorial, n)
+        repeated = measure(library.factorial, n)
+        print("{:>8} {:>12.6f} {:>12.6f} {:>12.6f} {:>8.1f}x".format(n, loop, first, repeated, loop / repeated))
+
+
+if __name__ == '__main__':
+    main()
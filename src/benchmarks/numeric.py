@@ -0,0 +1,66 @@
+"""!
+    @file numeric.py
+
+    @brief Benchmark of the numeric backends of the parser: cost and result of every mode
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.numeric [--terms 100] [--repeat 20] [--precision 28,50]
+    The expression is a chain of divisions and multiplications, the float
+    backend rounds every step, so its result drifts from the exact one.
+"""
+
+import argparse
+import decimal
+import time
+
+from calculator.calclib import numeric
+from calculator.calclib.expressions import MathParsing
+
+
+def chain(terms: int) -> str:
+    """!
+        @brief Function for creating the benchmark expression
+        @param terms Number of division and multiplication pairs
+        @return Expression string, exactly 1 without rounding
+    """
+
+    return "1" + "".join("÷{}×{}".format(i + 2, i + 2) for i in range(terms)) + "+1÷3×3-1"
+
+
+def measure(parser: MathParsing, expression: str, repeat: int):
+    """!
+        @brief Function for measuring the parsing of an expression
+        @return Tuple of the mean time of a call in seconds and the result string
+    """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = parser.parse(expression)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare numeric backends of the parser")
+    parser.add_argument("--terms", type=int, default=100, help="number of division and multiplication pairs")
+    parser.add_argument("--repeat", type=int, default=20, help="number of parsed expressions of every mode")
+    parser.add_argument("--precision", default="28,50", help="comma separated precisions of the decimal mode")
+    args = parser.parse_args()
+
+    expression = chain(args.terms)
+    backends = [("float", numeric.FLOAT), ("fraction", numeric.backend("fraction"))]
+    for precision in (int(digits) for digits in args.precision.split(",")):
+        backends.append(("decimal/{}".format(precision),
+                         numeric.backend("decimal", context=decimal.Context(prec=precision))))
+
+    baseline = None
+    print("{:>12} {:>12} {:>9} {:>14}".format("mode", "time [us]", "cost", "result"))
+    for name, backend in backends:
+        seconds, result = measure(MathParsing(backend), expression, args.repeat)
+        baseline = baseline or seconds
+        print("{:>12} {:>12.1f} {:>8.2f}x {:>14}".format(name, seconds * 1e6, seconds / baseline, result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""!
+    @file run.py
+
+    @brief Runner of the benchmark suite, results are written as JSON
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.run [-o results.json] [-k FILTER] [-r REPEAT]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+from benchmarks import suite
+
+
+def measure(function, repeat: int, min_time: float) -> dict:
+    """!
+        @brief Function for timing a single benchmark case
+        @param function Measured function without arguments
+        @param repeat Number of repetitions
+        @param min_time Minimal duration of one repetition in seconds
+        @return Dictionary with the best and mean time of one call in seconds
+    """
+
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(times), "mean": sum(times) / len(times), "number": number, "repeat": repeat}
+
+
+def commit() -> str:
+    """!
+        @brief Function for getting the current git commit
+        @return Commit hash or None outside of a git repository
+    """
+
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: list, repeat: int, min_time: float) -> dict:
+    """!
+        @brief Function for running benchmark cases
+        @param names Names of the cases
+        @param repeat Number of repetitions of every case
+        @param min_time Minimal duration of one repetition in seconds
+        @return JSON-serializable dictionary with the results
+    """
+
+    results = {}
+    for name in names:
+        results[name] = measure(suite.CASES[name](), repeat, min_time)
+        sys.stderr.write("{:<32} {:>12.3f} us\n".format(name, results[name]["best"] * 1e6))
+
+    return {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run calclib benchmarks")
+    parser.add_argument("-o", "--output", help="output JSON file, standard output by default")
+    parser.add_argument("-k", "--filter", default="", help="run only cases containing this string")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of repetitions of every case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimal duration of one repetition")
+    args = parser.parse_args()
+
+    names = [name for name in suite.CASES if args.filter in name]
+    report = json.dumps(run(names, args.repeat, args.min_time), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+
+
+if __name__ == '__main__':
+    main()
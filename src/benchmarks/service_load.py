@@ -0,0 +1,93 @@
+"""!
+    @file service_load.py
+
+    @brief Load generator measuring latency percentiles of the calculator service
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.service_load [-c CONNECTIONS] [-n REQUESTS] [--port PORT | --unix PATH]
+    Without --port or --unix a service is started in this process on a free
+    port. Every connection sends its requests concurrently, so the number of
+    requests in flight is the number of connections times --in-flight.
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks import suite
+from calculator.calclib import service
+
+
+async def load(client, requests: int, in_flight: int, latencies: list):
+    """!
+        @brief Function sending requests over a single connection
+        @param client Connected CalculatorClient
+        @param requests Number of requests
+        @param in_flight Number of concurrent requests of the connection
+        @param latencies List for the latencies of the requests in seconds
+    """
+
+    async def worker(count):
+        for i in range(count):
+            start = time.perf_counter()
+            await client.evaluate(suite.SHORT_EXPRESSION if i % 2 else "{}×(2+{})".format(i, i))
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker(requests // in_flight) for _ in range(in_flight)))
+
+
+async def run(args) -> dict:
+    """!
+        @brief Function running the load against a service
+        @param args Parsed command line arguments
+        @return Dictionary with throughput and latency percentiles of the clients and of the server
+    """
+
+    calculator = None
+    port = args.port
+    if port is None and args.unix is None:
+        calculator = service.CalculatorService(batch_size=args.batch_size)
+        server = await calculator.start()
+        port = server.sockets[0].getsockname()[1]
+
+    clients = [await service.CalculatorClient().connect(args.host, port, args.unix) for _ in range(args.connections)]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(load(client, args.requests, args.in_flight, latencies) for client in clients))
+    seconds = time.perf_counter() - start
+    server_stats = await clients[0].stats()
+    for client in clients:
+        await client.close()
+    if calculator is not None:
+        await calculator.close()
+
+    recorder = service.LatencyRecorder(len(latencies))
+    for latency in latencies:
+        recorder.record(latency)
+    return {"requests": len(latencies), "throughput": len(latencies) / seconds,
+            "latency": recorder.percentiles(), "server": server_stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure latency of the calculator service")
+    parser.add_argument("-c", "--connections", type=int, default=32, help="number of connections")
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="number of requests per connection")
+    parser.add_argument("--in-flight", type=int, default=4, help="number of concurrent requests per connection")
+    parser.add_argument("--host", default="127.0.0.1", help="host name of a running service")
+    parser.add_argument("--port", type=int, help="TCP port of a running service")
+    parser.add_argument("--unix", help="Unix socket of a running service")
+    parser.add_argument("--batch-size", type=int, default=64, help="batch size of the service started by this script")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print("{} requests, {:.0f} requests/s".format(report["requests"], report["throughput"]))
+    for name, latency in report["latency"].items():
+        print("client {}: {:9.3f} ms".format(name, latency * 1000))
+    for name, latency in report["server"]["latency"].items():
+        print("server {}: {:9.3f} ms".format(name, latency * 1000))
+
+
+if __name__ == '__main__':
+    main()
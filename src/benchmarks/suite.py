@@ -0,0 +1,175 @@
+"""!
+    @file suite.py
+
+    @brief Benchmark cases of the calclib hot paths
+
+    @date 17.10.2026
+
+    @par
+    Every case is a function registered with the @case decorator. It prepares
+    the data and returns a function without arguments, which is the measured
+    call.
+"""
+
+from calculator.calclib import angles, bytecode, cache, numeric, stack
+from calculator.calclib.advanced import Advanced
+from calculator.calclib.basic import Basic
+from calculator.calclib.expressions import MathParsing
+
+"""! Registered cases, name -> setup function """
+CASES = {}
+
+SHORT_EXPRESSION = "5+3×(2-8)"
+LONG_EXPRESSION = "+".join("{}×{}.5-(-{})÷4".format(i, i, i) for i in range(1, 101))
+NESTED_EXPRESSION = "(" * 50 + "1" + "+1)" * 50
+FUNCTION_EXPRESSION = "+".join("sin({}÷7)×log(2)(sqrt(2)({}))-cos({})+{}!".format(i, i, i, i % 10) for i in range(1, 51))
+REPEATED_EXPRESSION = "+".join("((x-{})×(y+1)-(x-{})^2)÷(y+1)".format(i % 4, i % 4) for i in range(40))
+
+
+def case(name: str):
+    """!
+        @brief Decorator for registering a benchmark case
+        @param name Name of the case, dot-separated group and operation
+    """
+
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def _parse(expression: str, backend=None):
+    parser = MathParsing(backend)
+    return lambda: parser.parse(expression)
+
+
+case("parse.short")(lambda: _parse(SHORT_EXPRESSION))
+case("parse.long")(lambda: _parse(LONG_EXPRESSION))
+case("parse.nested")(lambda: _parse(NESTED_EXPRESSION))
+case("parse.functions")(lambda: _parse(FUNCTION_EXPRESSION))
+case("parse.long.deferred")(lambda: _parse(LONG_EXPRESSION, numeric.backend("double")))
+case("parse.nested.deferred")(lambda: _parse(NESTED_EXPRESSION, numeric.backend("double")))
+case("parse.functions.deferred")(lambda: _parse(FUNCTION_EXPRESSION, numeric.backend("double")))
+case("parse.long.fraction")(lambda: _parse(LONG_EXPRESSION, numeric.backend("fraction")))
+case("parse.long.decimal")(lambda: _parse(LONG_EXPRESSION, numeric.backend("decimal")))
+
+
+def _parse_trigonometry(expression: str):
+    parser = MathParsing()
+    return lambda: parser.parse_trigonometry("sin", expression)
+
+
+case("parse_trigonometry.number")(lambda: _parse_trigonometry("0.5236"))
+case("parse_trigonometry.expression")(lambda: _parse_trigonometry("π÷6"))
+
+
+@case("parse.cached")
+def parse_cached():
+    """! The result cache of the process stays enabled, so this case should be run after the other parse cases """
+    cache.enable_cache()
+    parser = MathParsing()
+    parser.parse(LONG_EXPRESSION)
+    return lambda: parser.parse(LONG_EXPRESSION)
+
+
+@case("compiled.long")
+def compiled_long():
+    compiled = MathParsing().compile(LONG_EXPRESSION)
+    return compiled.evaluate
+
+
+@case("compiled.repeated")
+def compiled_repeated():
+    compiled = MathParsing().compile(REPEATED_EXPRESSION)
+    return lambda: compiled.evaluate({"x": 1.5, "y": 2})
+
+
+@case("bytecode.long")
+def bytecode_long():
+    program = bytecode.compile_expression(LONG_EXPRESSION)
+    return lambda: bytecode.run(program)
+
+
+@case("bytecode.nested")
+def bytecode_nested():
+    program = bytecode.compile_expression(NESTED_EXPRESSION)
+    return lambda: bytecode.run(program)
+
+
+@case("split_expression.long")
+def split_expression_long():
+    parser = MathParsing()
+
+    def run():
+        parser.tokens = []
+        parser.split_expression(LONG_EXPRESSION)
+
+    return run
+
+
+@case("check_semantics.long")
+def check_semantics_long():
+    parser = MathParsing()
+
+    def run():
+        parser.tokens = []
+        parser.split_expression(LONG_EXPRESSION)
+        parser.check_semantics()
+
+    return run
+
+
+def _push_pop(items):
+    def run():
+        for i in range(100):
+            items.push(i)
+        while not items.is_empty():
+            items.pop()
+
+    return run
+
+
+case("stack.push_pop")(lambda: _push_pop(stack.Stack()))
+case("stack.number_push_pop")(lambda: _push_pop(stack.NumberStack()))
+case("stack.operator_push_pop")(lambda: _push_pop(stack.OperatorStack()))
+
+
+@case("stack.number_indexed")
+def stack_number_indexed():
+    """! The way evaluate_deferred uses the NumberStack: reserved array and a local top index """
+    items = stack.NumberStack()
+
+    def run():
+        numbers = items.reserve(100)
+        top = -1
+        for i in range(100):
+            top += 1
+            numbers[top] = i
+        while top >= 0:
+            numbers[top]
+            top -= 1
+
+    return run
+
+
+def _operation(library, method: str, *args):
+    function = getattr(library, method)
+    return lambda: function(*args)
+
+
+case("basic.add")(lambda: _operation(Basic(), "add", 125.435735, 87.32612747))
+case("basic.sub")(lambda: _operation(Basic(), "sub", 125.435735, 87.32612747))
+case("basic.mul")(lambda: _operation(Basic(), "mul", 125.435735, 87.32612747))
+case("basic.div")(lambda: _operation(Basic(), "div", 125.435735, 87.32612747))
+case("advanced.power")(lambda: _operation(Advanced(), "power", 6.74, 4))
+case("advanced.rootn")(lambda: _operation(Advanced(), "rootn", 3, 14))
+case("advanced.logarithm")(lambda: _operation(Advanced(), "logarithm", 15, 2))
+case("advanced.sinus")(lambda: _operation(Advanced(), "sinus", 0.5236))
+case("advanced.cosines")(lambda: _operation(Advanced(), "cosines", 0.5236))
+case("advanced.tang")(lambda: _operation(Advanced(), "tang", 0.5236))
+case("advanced.cotg")(lambda: _operation(Advanced(), "cotg", 0.5236))
+case("angles.compute")(lambda: _operation(angles, "compute", "sin", 0.5236))
+case("advanced.factorial")(lambda: _operation(Advanced(), "factorial", 20))
+case("advanced.factorial.1000")(lambda: _operation(Advanced(), "factorial", 1000))
+case("advanced.factorial.10000")(lambda: _operation(Advanced(), "factorial", 10000))
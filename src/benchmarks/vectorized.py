@@ -0,0 +1,57 @@
+"""!
+    @file vectorized.py
+
+    @brief Benchmark of the NumPy evaluation backend against the scalar evaluate_many() path
+
+    @date 17.10.2026
+
+    @par
+    Usage: python -m benchmarks.vectorized [--sizes 1000,100000,10000000] [--expression EXPR]
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from calculator.calclib import numpy_backend
+from calculator.calclib.expressions import MathParsing
+
+EXPRESSION = "x×2+y÷3-x^2"
+
+
+def measure(function, *args):
+    """!
+        @brief Function for measuring a single call
+        @return Time of the call in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare NumPy and scalar evaluation of a compiled expression")
+    parser.add_argument("--sizes", default="1000,100000,10000000", help="comma separated numbers of rows")
+    parser.add_argument("--expression", default=EXPRESSION, help="expression with variables x and y")
+    args = parser.parse_args()
+
+    if not numpy_backend.available():
+        raise SystemExit("NumPy is not installed")
+
+    compiled = MathParsing().compile(args.expression)
+    generator = random.Random(0)
+
+    print("{:>10} {:>12} {:>12} {:>9}".format("rows", "scalar [s]", "numpy [s]", "speedup"))
+    for size in (int(size) for size in args.sizes.split(",")):
+        columns = {name: array('d', (generator.uniform(1, 100) for _ in range(size))) for name in compiled.variables}
+        arrays = {name: numpy_backend.numpy.frombuffer(column) for name, column in columns.items()}
+
+        scalar = measure(compiled.evaluate_many, columns)
+        vectorized = measure(numpy_backend.evaluate_columns, compiled, arrays)
+        print("{:>10} {:>12.4f} {:>12.4f} {:>8.1f}x".format(size, scalar, vectorized, scalar / vectorized))
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,8 @@ from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from PyQt5.Qt import Qt
 
-from calclib.expressions import MathParsing as MP
+from calclib import angles, cache
+from calclib.expressions import shared_parser
 
 
 class Window(QMainWindow):
@@ -214,6 +215,9 @@ class Window(QMainWindow):
         help_button = FunctionButton("?", self)
         help_button.setGeometry(388, 126, 53, 53)
 
+        self.unit_button = FunctionButton("rad", self)
+        self.unit_button.setGeometry(136, 126, 53, 53)
+
         """! Mouse manipulating with buttons"""
         mul_button.clicked.connect(lambda: self.action_button("mul"))
         division_button.clicked.connect(lambda: self.action_button("div"))
@@ -246,6 +250,7 @@ class Window(QMainWindow):
         logarithm_button.clicked.connect(self.action_logarithm)
         a_button.clicked.connect(self.action_a)
         help_button.clicked.connect(self.action_help)
+        self.unit_button.clicked.connect(self.action_unit)
 
     def action_button(self, param):
         """! @brief Generate text on the input field."""
@@ -285,7 +290,7 @@ class Window(QMainWindow):
         """! @brief Calculates a factorial """
 
         number = self.label.text()
-        result = MP().parse_factorial(number)
+        result = shared_parser().parse_factorial(number)
         self.label.setText(str(result))
 
     def action_logarithm(self):
@@ -311,14 +316,24 @@ class Window(QMainWindow):
             "tan": "tan",
             "ctg": "ctg",
         }
-        result = MP().parse_trigonometry(str(switcher.get(param)), number)
+        result = shared_parser().parse_trigonometry(str(switcher.get(param)), number)
         self.label.setText(str(result))
 
+    def action_unit(self):
+        """! @brief Switches the angle unit of trigonometric functions between radians and degrees """
+
+        if angles.unit() == angles.RADIANS:
+            angles.set_unit(angles.DEGREES)
+            self.unit_button.setText("deg")
+        else:
+            angles.set_unit(angles.RADIANS)
+            self.unit_button.setText("rad")
+
     def action_equal(self):
         """! @brief Shows the final result of the equation """
 
         text = self.label.text()
-        result = MP().parse(text)
+        result = shared_parser().parse(text)
         self.label.clear()
         self.label.setText(str(result))
 
@@ -450,6 +465,7 @@ class FunctionButton(Button):
 
 
 
+cache.enable_cache()
 App = QApplication(sys.argv)
 window = Window()
 window.show()
@@ -1,2 +1,2 @@
-from . import advanced, basic, exceptions, expressions, stack
-__all__ = [advanced, basic, exceptions, expressions, stack]
\ No newline at end of file
+from . import advanced, angles, basic, batch, bytecode, cache, compiler, exceptions, expressions, numeric, numpy_backend, optimizer, reader, service, stack, stats, tokenizer, vector
+__all__ = [advanced, angles, basic, batch, bytecode, cache, compiler, exceptions, expressions, numeric, numpy_backend, optimizer, reader, service, stack, stats, tokenizer, vector]
\ No newline at end of file
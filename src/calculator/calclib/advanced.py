@@ -11,19 +11,58 @@
 
 
 import sys
+import threading
 
-from . import basic
+from . import angles, basic
 from . import exceptions as e
 import math
 
+"""! Factorials of 0..20 (all 64-bit results), FACTORIALS[n] == n! """
+FACTORIALS = (1, 1, 2, 6, 24, 120, 720, 5040, 40320, 362880, 3628800, 39916800, 479001600, 6227020800,
+              87178291200, 1307674368000, 20922789888000, 355687428096000, 6402373705728000,
+              121645100408832000, 2432902008176640000)
+
+"""! Factorials computed so far, the list grows up to FACTORIAL_CACHE_LIMIT as larger numbers are requested """
+_factorials = list(FACTORIALS)
+_factorials_lock = threading.Lock()
+
+"""! Larger factorials are computed by math.factorial (binary splitting) and they are not cached """
+FACTORIAL_CACHE_LIMIT = 1000
+
+"""! Largest operand of factorial, 100000! has 456574 digits """
+FACTORIAL_MAX = 10 ** 5
+
+
+def factorial_of(n: int) -> int:
+    """!
+        @brief Function for computing the factorial of a non-negative integer
+        @param n Operand
+        @return n!
+    """
+
+    if n < len(FACTORIALS):
+        return FACTORIALS[n]
+    if n > FACTORIAL_CACHE_LIMIT:
+        return math.factorial(n)
+    if n >= len(_factorials):
+        with _factorials_lock:
+            while len(_factorials) <= n:
+                _factorials.append(_factorials[-1] * len(_factorials))
+    return _factorials[n]
+
 
 class Advanced(basic.Basic):
     """!
     @brief Base class "Advanced", representation of advanced mathematical operations
     """
 
-    def __init__(self):
-        self.basic = basic.Basic()
+    def __init__(self, backend=None):
+        """!
+            @param backend Numeric backend from numeric.py, see basic.Basic
+        """
+
+        super().__init__(backend)
+        self.basic = basic.Basic(backend)
 
     def power(self, base: float, exponent: float) -> float:
         """!
@@ -43,13 +82,10 @@ class Advanced(basic.Basic):
         """
 
         try:
-            if x < 0 or isinstance(x, float):
+            if x < 0 or isinstance(x, float) or x > FACTORIAL_MAX:
                 raise e.BadOperandException
 
-            result = 1
-            for num in range(1, x + 1):
-                result = result * num
-            return self.int_translate(result)
+            return factorial_of(x)
         except e.BadOperandException:
             sys.stderr.write("Error: wrong factorial operand")
 
@@ -88,34 +124,37 @@ class Advanced(basic.Basic):
     def sinus(self, x):
         """!
             @brief Method for sinus function
-            @param x An angle in radians (pi/2, pi/4, pi/3, etc.)
+            @param x An angle in the unit of angles.unit() (radians by default)
             @return The sine of the given parameter value
         """
 
-        return self.int_translate(math.sin(x))
+        return self.int_translate(angles.value("sin", float(x)))
 
     def cosines(self, x):
         """!
             @brief Method for cosines function
-            @param x An angle in radians (pi/2, pi/4, pi/3, etc.)
+            @param x An angle in the unit of angles.unit() (radians by default)
             @return The cosine of the given parameter value
         """
 
-        return self.int_translate(math.cos(x))
+        return self.int_translate(angles.value("cos", float(x)))
 
     def tang(self, x):
         """!
-            @brief Method for tangents function
-            @param x An angle in radians (pi/2, pi/4, pi/3, etc.)
+            @brief Method for tangents function, the tangent is rounded only once
+            @param x An angle in the unit of angles.unit() (radians by default)
             @return The tangent  of the given parameter value
+            @exception ZeroDivisionError The cosine of the angle is zero
         """
 
-        return self.div(self.sinus(x), self.cosines(x))
+        return self.int_translate(angles.value("tan", float(x)))
 
     def cotg(self, x):
         """!
-            @brief Method for cotangents function
-            @param x An angle in radians (pi/2, pi/4, pi/3, etc.)
+            @brief Method for cotangents function, cosine and sine are divided before the only rounding
+            @param x An angle in the unit of angles.unit() (radians by default)
             @return The cotangent  of the given parameter value
+            @exception ZeroDivisionError The sine of the angle is zero
         """
-        return self.div(self.cosines(x), self.sinus(x))
+
+        return self.int_translate(angles.value("ctg", float(x)))
@@ -0,0 +1,185 @@
+"""!
+    @file angles.py
+
+    @brief Angle unit of the trigonometric functions and their table of common angles
+
+    @date 17.10.2026
+
+    @par
+    Angles are in radians by default, set_unit(DEGREES) switches all Advanced
+    trigonometric functions of the process to degrees. Multiples of 15 degrees
+    (π/12 radians) are answered from a table of exact values, so sin(30) is
+    0.5 and tan(90) is undefined instead of a huge number. In radians both
+    multiples of math.pi/12 and of Basic.pi/12 are in the table, the π token
+    of the calculator is 3.1416, so sin(π÷6) is 0.5 too. Results of other
+    angles are memoized per function, up to MEMO_LIMIT angles, so repeated
+    angles don't call libm or round again. Changing the unit clears the memo
+    and the result cache of parsed expressions.
+"""
+
+import math
+import threading
+
+from . import basic, cache
+
+RADIANS = "radians"
+DEGREES = "degrees"
+UNITS = (RADIANS, DEGREES)
+
+"""! Maximal number of memoized angles of every function """
+MEMO_LIMIT = 4096
+
+"""! Distance from a multiple of π/12 (in twelfths of π) which is still looked up in the table """
+TOLERANCE = 1e-12
+
+"""! Sines of 0, 15, ..., 90 degrees """
+_QUARTER = (0.0, (math.sqrt(6) - math.sqrt(2)) / 4, 0.5, math.sqrt(2) / 2, math.sqrt(3) / 2,
+            (math.sqrt(6) + math.sqrt(2)) / 4, 1.0)
+
+
+def _sine(step: int) -> float:
+    """!
+        @brief Function for the exact sine of a multiple of 15 degrees
+        @param step Angle in multiples of 15 degrees, 0 to 23
+        @return Sine of the angle
+    """
+
+    if step >= 12:
+        return -_sine(step - 12)
+    return _QUARTER[step] if step <= 6 else _QUARTER[12 - step]
+
+
+def _table():
+    """!
+        @brief Function for building the table of exact values
+        @return Dictionary function -> tuple of 24 rounded values, None where the function is not defined
+    """
+
+    sines = [_sine(step) for step in range(24)]
+    cosines = [_sine((step + 6) % 24) for step in range(24)]
+    rounded = basic.Basic.int_translate
+    return {
+        "sin": tuple(rounded(value) for value in sines),
+        "cos": tuple(rounded(value) for value in cosines),
+        "tan": tuple(None if cos == 0 else rounded(sin / cos) for sin, cos in zip(sines, cosines)),
+        "ctg": tuple(None if sin == 0 else rounded(cos / sin) for sin, cos in zip(sines, cosines)),
+    }
+
+
+"""! Exact values of the functions at multiples of 15 degrees, TABLE[function][angle // 15 % 24] """
+TABLE = _table()
+
+"""! Functions of the angle in radians computed when the angle is not in the table """
+FUNCTIONS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "ctg": lambda x: math.cos(x) / math.sin(x),
+}
+
+_unit = RADIANS
+_memo = {function: {} for function in FUNCTIONS}
+_lock = threading.Lock()
+
+
+def set_unit(unit: str):
+    """!
+        @brief Function for setting the angle unit of the process
+        @param unit RADIANS or DEGREES
+        @exception ValueError Unknown unit
+    """
+
+    global _unit
+    if unit not in UNITS:
+        raise ValueError("Unknown angle unit {}".format(unit))
+    with _lock:
+        if unit == _unit:
+            return
+        _unit = unit
+        for memo in _memo.values():
+            memo.clear()
+    results = cache.current()
+    if results is not None:
+        results.clear()
+
+
+def unit() -> str:
+    """!
+        @brief Function for getting the angle unit of the process
+        @return RADIANS or DEGREES
+    """
+
+    return _unit
+
+
+def _nearest(steps) -> int:
+    """!
+        @brief Function for rounding an angle in multiples of 15 degrees to a position in the table
+        @param steps Angle in multiples of 15 degrees
+        @return Position from 0 to 23, None if the angle is not close to a multiple or too large
+
+        @par
+        Doubles of large angles are spaced wider than TOLERANCE, so every one of
+        them would look like a multiple, these angles are computed by libm.
+    """
+
+    if not math.isfinite(steps) or math.ulp(steps) > TOLERANCE:
+        return None
+    nearest = round(steps)
+    if abs(steps - nearest) > TOLERANCE:
+        return None
+    return nearest % 24
+
+
+def step(x) -> int:
+    """!
+        @brief Function for finding the position of an angle in the table
+        @param x Angle in the current unit
+        @return Angle in multiples of 15 degrees from 0 to 23, None if the angle is not in the table
+    """
+
+    if _unit == DEGREES:
+        return _nearest(x / 15)
+    position = _nearest(x * 12 / math.pi)
+    if position is None:
+        position = _nearest(x * 12 / basic.Basic.pi)
+    return position
+
+
+def compute(function: str, x):
+    """!
+        @brief Function for computing a trigonometric function without the memo
+        @param function "sin", "cos", "tan" or "ctg"
+        @param x Angle in the current unit
+        @return Rounded value of the function
+        @exception ZeroDivisionError The function is not defined for the angle
+    """
+
+    position = step(x)
+    if position is not None:
+        result = TABLE[function][position]
+        if result is None:
+            raise ZeroDivisionError
+        return result
+
+    if _unit == DEGREES:
+        x = math.radians(x)
+    return basic.Basic.int_translate(FUNCTIONS[function](x))
+
+
+def value(function: str, x):
+    """!
+        @brief Function for getting the value of a trigonometric function, repeated angles are memoized
+        @param function "sin", "cos", "tan" or "ctg"
+        @param x Angle in the current unit
+        @return Rounded value of the function
+        @exception ZeroDivisionError The function is not defined for the angle
+    """
+
+    memo = _memo[function]
+    result = memo.get(x)
+    if result is None:
+        result = compute(function, x)
+        if len(memo) < MEMO_LIMIT:
+            memo[x] = result
+    return result
@@ -18,8 +18,15 @@ class Basic:
     pi = 3.1416
     exp = 2.7183
 
-    def __init__(self):
-        pass
+    def __init__(self, backend=None):
+        """!
+            @param backend Numeric backend from numeric.py, results are rounded floats (the static int_translate) if None
+        """
+
+        if backend is not None:
+            self.int_translate = backend.normalize
+            self.pi = backend.pi
+            self.exp = backend.exp
 
     def add(self, x: float, y: float):
         """!
@@ -73,6 +80,8 @@ class Basic:
             @return Rounded number
         """
 
+        if type(num) is int:
+            return num
         if isinstance(num, complex):
             num = num.real
         if float(num).is_integer():
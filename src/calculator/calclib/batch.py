@@ -0,0 +1,109 @@
+"""!
+    @file batch.py
+
+    @brief Batch evaluation of files with one expression per line in a process pool
+
+    @date 17.10.2026
+
+    @par
+    The input is streamed in chunks of lines, which are evaluated by the
+    workers. At most a few chunks per worker are in flight, so the memory
+    stays bounded for any input size. Results are written in the order of the
+    input, one per line. The command line interface is evaluate.py.
+"""
+
+import itertools
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from . import expressions
+
+"""! Summary of a batch run """
+BatchReport = namedtuple("BatchReport", ["count", "seconds"])
+
+"""! Number of chunks submitted ahead for every worker """
+CHUNKS_PER_WORKER = 2
+
+
+def read_chunks(stream, chunk_size: int):
+    """!
+        @brief Generator of chunks of expressions from a text stream
+        @param stream Text file object with one expression per line
+        @param chunk_size Number of lines in a chunk
+        @return Generator of lists of expressions without line endings
+    """
+
+    while True:
+        chunk = [line.rstrip("\r\n") for line in itertools.islice(stream, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_line(parser, expression: str) -> str:
+    """!
+        @brief Function for evaluating a single expression, an unexpected error fails only its own line
+        @param parser MathParsing object
+        @param expression Expression string
+        @return Result string or error message
+    """
+
+    try:
+        return parser.parse(expression)
+    except Exception:
+        return "Couldn't parse expression"
+
+
+def evaluate_chunk(chunk: list) -> list:
+    """!
+        @brief Function for evaluating a chunk of expressions, the parser of the worker is reused
+        @param chunk List of expressions
+        @return List of result strings
+    """
+
+    parser = expressions.shared_parser()
+    return [evaluate_line(parser, expression) for expression in chunk]
+
+
+def write_results(output, results: list):
+    """!
+        @brief Function for writing results, one per line
+        @param output Text file object
+        @param results List of result strings
+    """
+
+    output.write("\n".join(results))
+    output.write("\n")
+
+
+def run_batch(stream, output, workers: int = None, chunk_size: int = 1000) -> BatchReport:
+    """!
+        @brief Function for evaluating all expressions of a stream in parallel processes
+        @param stream Text file object with one expression per line
+        @param output Text file object for the results
+        @param workers Number of processes, os.cpu_count() by default, 1 evaluates in this process
+        @param chunk_size Number of lines sent to a worker at once
+        @return BatchReport with the number of expressions and the duration in seconds
+    """
+
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    start = time.perf_counter()
+    if workers == 1:
+        for chunk in read_chunks(stream, chunk_size):
+            write_results(output, evaluate_chunk(chunk))
+            count += len(chunk)
+        return BatchReport(count, time.perf_counter() - start)
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in read_chunks(stream, chunk_size):
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                write_results(output, pending.popleft().result())
+            pending.append(executor.submit(evaluate_chunk, chunk))
+            count += len(chunk)
+        while pending:
+            write_results(output, pending.popleft().result())
+    return BatchReport(count, time.perf_counter() - start)
@@ -0,0 +1,190 @@
+"""!
+    @file bytecode.py
+
+    @brief Compact postfix bytecode of math expressions and its evaluator
+
+    @date 17.10.2026
+
+    @par
+    The postfix program of a compiled expression is assembled into opcodes in
+    array('B'), number constants in array('d') and variable slots in
+    array('H'). PUSH takes its operand from the constants, LOAD, STORE and
+    SHARED take theirs from the slots, in order, so opcodes have no arguments. The evaluator runs the program on
+    a stack allocated once with the depth computed by the assembler, there are
+    no strings, Stack objects or float() conversions in the loop.
+"""
+
+from array import array
+from collections import namedtuple
+
+from . import basic, compiler, expressions
+from . import exceptions as e
+
+PUSH = 0
+LOAD = 1
+NEG = 2
+ADD = 3
+SUB = 4
+MUL = 5
+DIV = 6
+POW = 7
+STORE = 8
+SHARED = 9
+SIN = 10
+COS = 11
+TAN = 12
+CTG = 13
+FACTORIAL = 14
+LOG = 15
+ROOT = 16
+
+"""! Opcodes of the operators of compiler programs """
+OPCODES = {compiler.NEGATE: NEG, '+': ADD, '-': SUB, '×': MUL, '÷': DIV, '^': POW,
+           'sin': SIN, 'cos': COS, 'tan': TAN, 'ctg': CTG, '!': FACTORIAL, 'log': LOG, 'sqrt': ROOT}
+
+"""! Functions of the function opcodes """
+CALLS = {OPCODES[op]: function for op, function in list(compiler.UNARY_OPERATIONS.items()) +
+         list(compiler.OPERATIONS.items()) if OPCODES[op] >= SIN}
+
+"""! Assembled program, variables are names of the variable slots, shared is the number of shared results and
+     stack_size is the maximal stack depth """
+Program = namedtuple("Program", ["code", "constants", "slots", "variables", "shared", "stack_size"])
+
+
+def assemble(compiled: compiler.CompiledExpression) -> Program:
+    """!
+        @brief Function for assembling the postfix program of a compiled expression
+        @param compiled CompiledExpression object
+        @return Program tuple
+    """
+
+    code = array("B")
+    constants = array("d")
+    slots = array("H")
+    depth = 0
+    stack_size = 0
+    for op, value in compiled.program:
+        if op == compiler.NUMBER:
+            code.append(PUSH)
+            constants.append(value)
+            depth += 1
+        elif op == compiler.VARIABLE:
+            code.append(LOAD)
+            slots.append(value)
+            depth += 1
+        elif op == compiler.SHARED:
+            code.append(SHARED)
+            slots.append(value)
+            depth += 1
+        elif op == compiler.STORE:
+            code.append(STORE)
+            slots.append(value)
+        else:
+            code.append(OPCODES[op])
+            if op in compiler.OPERATIONS:
+                depth -= 1
+        stack_size = max(stack_size, depth)
+
+    return Program(code, constants, slots, compiled.variables, compiled.shared, stack_size)
+
+
+def compile_expression(expression: str, parser: expressions.MathParsing = None, optimize: bool = False) -> Program:
+    """!
+        @brief Function for compiling an expression string to bytecode
+        @param expression Expression string
+        @param parser MathParsing object used for compilation, a new one if None
+        @param optimize Fold constants and remove identities, see optimizer.py
+        @return Program tuple
+        @exception BadExpressionException Expression is not correct
+    """
+
+    return assemble((parser or expressions.MathParsing()).compile(expression, optimize))
+
+
+def run(program: Program, values=()):
+    """!
+        @brief Function for evaluating the bytecode
+        @param program Program tuple
+        @param values Values of the variables in order of program.variables
+        @return Result of the expression, every operation is rounded like the Basic operations
+        @exception EvaluationException Division by zero, non-integer exponent or wrong function operand
+
+        @par
+        Intermediate results are floats, so the result can differ from
+        CompiledExpression only above 2**53, where Basic keeps exact integers.
+    """
+
+    stack = [0.0] * program.stack_size
+    shared = [0.0] * program.shared
+    constants = program.constants
+    slots = program.slots
+    top = -1
+    constant = 0
+    slot = 0
+    try:
+        for op in program.code:
+            if op == PUSH:
+                top += 1
+                stack[top] = constants[constant]
+                constant += 1
+            elif op == LOAD:
+                top += 1
+                stack[top] = values[slots[slot]]
+                slot += 1
+            elif op == SHARED:
+                top += 1
+                stack[top] = shared[slots[slot]]
+                slot += 1
+            elif op == STORE:
+                shared[slots[slot]] = stack[top]
+                slot += 1
+            elif op == NEG:
+                stack[top] = round(-stack[top], 7)
+            elif SIN <= op <= FACTORIAL:
+                stack[top] = CALLS[op](stack[top])
+            else:
+                operand2 = stack[top]
+                top -= 1
+                operand1 = stack[top]
+                if op == ADD:
+                    result = operand1 + operand2
+                elif op == SUB:
+                    result = operand1 - operand2
+                elif op == MUL:
+                    result = operand1 * operand2
+                elif op == DIV:
+                    if operand2 == 0:
+                        raise e.EvaluationException("Division by zero")
+                    result = operand1 / operand2
+                elif op >= LOG:
+                    result = CALLS[op](operand1, operand2)
+                else:
+                    if not float(operand2).is_integer():
+                        raise e.EvaluationException("Exponent is not an integer")
+                    try:
+                        result = pow(operand1, operand2)
+                    except (ZeroDivisionError, OverflowError) as error:
+                        raise e.EvaluationException(str(error)) from error
+                stack[top] = round(result, 7)
+    except OverflowError as error:
+        raise e.EvaluationException(str(error)) from error
+
+    return basic.Basic.int_translate(stack[0])
+
+
+def evaluate(program: Program, variables: dict = None):
+    """!
+        @brief Function for evaluating the bytecode with named variables
+        @param program Program tuple
+        @param variables Dictionary with values of the variables
+        @return Result of the expression
+        @exception EvaluationException Unbound variable, division by zero, non-integer exponent or wrong
+                   function operand
+    """
+
+    variables = variables or {}
+    try:
+        values = tuple(variables[name] for name in program.variables)
+    except KeyError as error:
+        raise e.EvaluationException("Unbound variable {}".format(error.args[0])) from None
+    return run(program, values)
@@ -0,0 +1,136 @@
+"""!
+    @file cache.py
+
+    @brief Process-level LRU cache of parsed expression results
+
+    @date 17.10.2026
+
+    @par
+    The cache is opt-in: it is created by enable_cache() and it is shared by
+    all MathParsing instances of the process. Keys are normalized expression
+    strings, the least recently used result is evicted when the cache is full.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+"""! Statistics of the cache """
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "size", "maxsize"])
+
+
+class LRUCache:
+    """!
+        @brief Class "LRUCache", size-bounded mapping which forgets the least recently used items
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key):
+        """!
+            @brief Method for looking up a cached item, the item becomes the most recently used
+            @param key Key of the item
+            @return Cached item or None
+        """
+
+        with self.lock:
+            try:
+                value = self.items[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """!
+            @brief Method for storing an item, the least recently used item is evicted if the cache is full
+            @param key Key of the item
+            @param value Item
+        """
+
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            if len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """! @brief Method for removing all items and resetting the counters """
+
+        with self.lock:
+            self.items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """!
+            @brief Method for getting the statistics of the cache
+            @return CacheInfo tuple
+        """
+
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self.items), self.maxsize)
+
+
+"""! Cache of the process, None if caching is disabled """
+_results = None
+
+
+def normalize(expression: str) -> str:
+    """!
+        @brief Function for normalizing an expression, so equal expressions have the same key
+        @param expression Expression string
+        @return Expression without surrounding whitespace and with single spaces inside
+    """
+
+    return " ".join(expression.split())
+
+
+def enable_cache(maxsize: int = 1024):
+    """!
+        @brief Function for enabling the result cache of the process, an existing cache is replaced
+        @param maxsize Maximal number of cached expressions
+        @return New LRUCache object
+    """
+
+    global _results
+    _results = LRUCache(maxsize)
+    return _results
+
+
+def disable_cache():
+    """! @brief Function for disabling the result cache of the process, cached results are dropped """
+
+    global _results
+    _results = None
+
+
+def current():
+    """!
+        @brief Function for getting the result cache of the process
+        @return LRUCache object or None if caching is disabled
+    """
+
+    return _results
+
+
+def cache_info():
+    """!
+        @brief Function for getting the statistics of the result cache
+        @return CacheInfo tuple or None if caching is disabled
+    """
+
+    results = _results
+    return None if results is None else results.info()
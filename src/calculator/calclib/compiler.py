@@ -0,0 +1,423 @@
+"""!
+    @file compiler.py
+
+    @brief Module with compiled math expressions, which are parsed once and evaluated many times
+
+    @date 17.10.2026
+
+"""
+
+from collections import namedtuple
+
+from . import advanced
+from . import exceptions as e
+
+NUMBER = "num"
+VARIABLE = "var"
+NEGATE = "neg"
+STORE = "store"
+SHARED = "shared"
+
+"""! Node of the expression tree, op is an operator and args are its operands (value for numbers) """
+Node = namedtuple("Node", ["op", "args"])
+
+_ADVANCED = advanced.Advanced()
+
+
+def number(value) -> Node:
+    """!
+        @brief Function for creating a number node of the expression tree
+        @param value Number or number string
+        @return Tree node
+    """
+
+    return Node(NUMBER, (float(value),))
+
+
+def variable(name: str) -> Node:
+    """!
+        @brief Function for creating a variable node of the expression tree
+        @param name Variable name
+        @return Tree node
+    """
+
+    return Node(VARIABLE, (name,))
+
+
+def operation(op: str, *args) -> Node:
+    """!
+        @brief Function for creating an operation node of the expression tree
+        @param op Operator
+        @param args Operand nodes
+        @return Tree node
+    """
+
+    return Node(op, args)
+
+
+def divide(divident: float, divisor: float):
+    """!
+        @brief Division of two numbers for compiled expressions
+        @param divident The number to be divided
+        @param divisor The number to divide by
+        @return Division operation result
+    """
+
+    if divisor == 0:
+        raise e.EvaluationException("Division by zero")
+    return _ADVANCED.div(divident, divisor)
+
+
+def power(base: float, exponent: float):
+    """!
+        @brief Exponentiation for compiled expressions, the exponent has to be an integer
+        @param base Base number
+        @param exponent Exponent number
+        @return Power of the given number
+    """
+
+    if not float(exponent).is_integer():
+        raise e.EvaluationException("Exponent is not an integer")
+    try:
+        return _ADVANCED.power(base, exponent)
+    except (ZeroDivisionError, OverflowError) as error:
+        raise e.EvaluationException(str(error)) from error
+
+
+def negate(operand: float):
+    """!
+        @brief Unary minus for compiled expressions
+        @param operand Operand
+        @return Negated number
+    """
+
+    return _ADVANCED.sub(0, operand)
+
+
+def sine(x: float):
+    """!
+        @brief Sine for compiled expressions
+        @param x An angle in radians
+        @return The sine of the angle
+    """
+
+    try:
+        return _ADVANCED.sinus(x)
+    except ValueError:
+        raise e.EvaluationException("Sine of a wrong operand") from None
+
+
+def cosine(x: float):
+    """!
+        @brief Cosine for compiled expressions
+        @param x An angle in radians
+        @return The cosine of the angle
+    """
+
+    try:
+        return _ADVANCED.cosines(x)
+    except ValueError:
+        raise e.EvaluationException("Cosine of a wrong operand") from None
+
+
+def tangent(x: float):
+    """!
+        @brief Tangent for compiled expressions
+        @param x An angle in radians
+        @return The tangent of the angle
+    """
+
+    try:
+        return _ADVANCED.tang(x)
+    except ZeroDivisionError:
+        raise e.EvaluationException("Tangent is not defined") from None
+    except ValueError:
+        raise e.EvaluationException("Tangent of a wrong operand") from None
+
+
+def cotangent(x: float):
+    """!
+        @brief Cotangent for compiled expressions
+        @param x An angle in radians
+        @return The cotangent of the angle
+    """
+
+    try:
+        return _ADVANCED.cotg(x)
+    except ZeroDivisionError:
+        raise e.EvaluationException("Cotangent is not defined") from None
+    except ValueError:
+        raise e.EvaluationException("Cotangent of a wrong operand") from None
+
+
+def factorial(x: float):
+    """!
+        @brief Factorial for compiled expressions, the operand has to be a non-negative integer
+        @param x Operand
+        @return Factorial of the operand, an exact integer, operations with large ones raise OverflowError
+    """
+
+    if x < 0 or not float(x).is_integer():
+        raise e.EvaluationException("Factorial of a wrong operand")
+    if x > advanced.FACTORIAL_MAX:
+        raise e.EvaluationException("Factorial operand is too large")
+    return _ADVANCED.factorial(int(x))
+
+
+def logarithm(base: float, number: float):
+    """!
+        @brief Logarithm for compiled expressions, log(base)(number)
+        @param base Positive base other than 1
+        @param number Positive antilogarithm number
+        @return Logarithm of the number
+    """
+
+    if base <= 0 or base == 1 or number <= 0:
+        raise e.EvaluationException("Logarithm of a wrong operand")
+    return _ADVANCED.logarithm(number, base)
+
+
+def root(degree: float, radicand: float):
+    """!
+        @brief N-th root for compiled expressions, sqrt(degree)(radicand)
+        @param degree Positive integer degree
+        @param radicand The number from which the root has to be extracted, negative only for odd degrees
+        @return Root of the radicand
+    """
+
+    if degree < 1 or not float(degree).is_integer():
+        raise e.EvaluationException("Root degree is not a positive integer")
+    if radicand < 0:
+        if degree % 2 == 0:
+            raise e.EvaluationException("Even root of a negative number")
+        return negate(_ADVANCED.rootn(int(degree), -radicand))
+    return _ADVANCED.rootn(int(degree), radicand)
+
+
+"""! Functions applied by the binary operators and functions with two arguments """
+OPERATIONS = {
+    '+': _ADVANCED.add,
+    '-': _ADVANCED.sub,
+    '×': _ADVANCED.mul,
+    '÷': divide,
+    '^': power,
+    'log': logarithm,
+    'sqrt': root,
+}
+
+"""! Functions applied by unary minus and functions with one argument """
+UNARY_OPERATIONS = {
+    NEGATE: negate,
+    'sin': sine,
+    'cos': cosine,
+    'tan': tangent,
+    'ctg': cotangent,
+    '!': factorial,
+}
+
+
+class CompiledExpression:
+    """!
+        @brief Class "CompiledExpression", immutable representation of a parsed math expression
+    """
+
+    __slots__ = ("source", "tree", "variables", "program", "shared", "deduplicated")
+
+    def __init__(self, source: str, tree: Node):
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "tree", tree)
+        object.__setattr__(self, "variables", tuple(self.collect_variables(tree)))
+        program, shared, deduplicated = self.flatten(tree, self.variables)
+        object.__setattr__(self, "program", tuple(program))
+        object.__setattr__(self, "shared", shared)
+        object.__setattr__(self, "deduplicated", deduplicated)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledExpression is immutable")
+
+    def __repr__(self):
+        return "CompiledExpression({!r})".format(self.source)
+
+    @staticmethod
+    def collect_variables(tree: Node):
+        """!
+            @brief Method for finding variable names used in the expression tree
+            @param tree Root node of the expression tree
+            @return List of variable names in order of appearance
+        """
+
+        names = []
+        nodes = [tree]
+        while nodes:
+            node = nodes.pop()
+            if node.op == VARIABLE:
+                if node.args[0] not in names:
+                    names.append(node.args[0])
+            elif node.op != NUMBER:
+                nodes.extend(reversed(node.args))
+        return names
+
+    @staticmethod
+    def number_subtrees(tree: Node):
+        """!
+            @brief Method for numbering subtrees, structurally identical subtrees get the same number
+            @param tree Root node of the expression tree
+            @return Tuple of dictionaries id(node) -> number and number -> size of the subtree
+        """
+
+        numbers = {}
+        keys = {}
+        sizes = {}
+        nodes = [(tree, False)]
+        while nodes:
+            node, visited = nodes.pop()
+            if node.op == NUMBER or node.op == VARIABLE:
+                key = node
+                size = 1
+            elif visited:
+                key = (node.op,) + tuple(numbers[id(arg)] for arg in node.args)
+                size = 1 + sum(sizes[numbers[id(arg)]] for arg in node.args)
+            else:
+                nodes.append((node, True))
+                nodes.extend((arg, False) for arg in node.args)
+                continue
+            number = keys.setdefault(key, len(keys))
+            numbers[id(node)] = number
+            sizes[number] = size
+        return numbers, sizes
+
+    @staticmethod
+    def flatten(tree: Node, variables: tuple):
+        """!
+            @brief Method for converting the expression tree to the postfix program
+            @param tree Root node of the expression tree
+            @param variables Variable names, variables are referenced by index in this tuple
+            @return Tuple of the list of (op, value) instructions, number of shared results and number of
+                    deduplicated nodes
+
+            @par
+            Operations repeated in the tree are evaluated only the first time,
+            their result is stored by STORE and pushed again by SHARED.
+        """
+
+        numbers, sizes = CompiledExpression.number_subtrees(tree)
+        counts = {}
+        nodes = [tree]
+        while nodes:
+            node = nodes.pop()
+            number = numbers[id(node)]
+            counts[number] = counts.get(number, 0) + 1
+            if counts[number] == 1 and node.op != NUMBER and node.op != VARIABLE:
+                nodes.extend(node.args)
+
+        program = []
+        slots = {}
+        deduplicated = 0
+        nodes = [(tree, False)]
+        while nodes:
+            node, visited = nodes.pop()
+            number = numbers[id(node)]
+            if node.op == NUMBER:
+                program.append((NUMBER, node.args[0]))
+            elif node.op == VARIABLE:
+                program.append((VARIABLE, variables.index(node.args[0])))
+            elif visited:
+                program.append((node.op, None))
+                if number in slots:
+                    program.append((STORE, slots[number]))
+            elif number in slots:
+                program.append((SHARED, slots[number]))
+                deduplicated += sizes[number]
+            else:
+                if counts[number] > 1:
+                    slots[number] = len(slots)
+                nodes.append((node, True))
+                for arg in reversed(node.args):
+                    nodes.append((arg, False))
+        return program, len(slots), deduplicated
+
+    def run(self, values: tuple):
+        """!
+            @brief Method for running the postfix program
+            @param values Values of the variables in order of self.variables
+            @return Result of the expression
+            @exception EvaluationException Division by zero, non-integer exponent or wrong function operand
+        """
+
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        shared = [None] * self.shared
+        try:
+            for op, value in self.program:
+                if op == NUMBER:
+                    push(value)
+                elif op == VARIABLE:
+                    push(values[value])
+                elif op == SHARED:
+                    push(shared[value])
+                elif op == STORE:
+                    shared[value] = stack[-1]
+                elif op in UNARY_OPERATIONS:
+                    push(UNARY_OPERATIONS[op](pop()))
+                else:
+                    operand2 = pop()
+                    push(OPERATIONS[op](pop(), operand2))
+        except OverflowError as error:
+            raise e.EvaluationException(str(error)) from error
+
+        return _ADVANCED.int_translate(stack[-1])
+
+    def evaluate(self, variables: dict = None):
+        """!
+            @brief Method for evaluating the compiled expression
+            @param variables Dictionary with values of the variables
+            @return Result of the expression
+            @exception EvaluationException Unbound variable, division by zero, non-integer exponent or wrong
+                       function operand
+        """
+
+        return self.run(self.bind(variables or {}))
+
+    def evaluate_many(self, bindings):
+        """!
+            @brief Method for evaluating the compiled expression for many values of the variables
+            @param bindings Sequence of dictionaries (rows) or dictionary of sequences (columns)
+            @return List of results, None for rows which couldn't be evaluated
+            @exception EvaluationException Unbound variable
+        """
+
+        if isinstance(bindings, dict):
+            try:
+                columns = [bindings[name] for name in self.variables]
+            except KeyError as error:
+                raise e.EvaluationException("Unbound variable {}".format(error.args[0])) from None
+            lengths = set(len(column) for column in bindings.values())
+            if len(lengths) > 1:
+                raise ValueError("Columns have different lengths")
+            rows = zip(*columns) if columns else [()] * (lengths.pop() if lengths else 0)
+        else:
+            rows = (self.bind(row) for row in bindings)
+
+        results = []
+        append = results.append
+        run = self.run
+        for values in rows:
+            try:
+                append(run(values))
+            except e.EvaluationException:
+                append(None)
+        return results
+
+    def bind(self, variables: dict) -> tuple:
+        """!
+            @brief Method for ordering values of the variables for the postfix program
+            @param variables Dictionary with values of the variables
+            @return Tuple of values in order of self.variables
+            @exception EvaluationException Unbound variable
+        """
+
+        try:
+            return tuple(variables[name] for name in self.variables)
+        except KeyError as error:
+            raise e.EvaluationException("Unbound variable {}".format(error.args[0])) from None
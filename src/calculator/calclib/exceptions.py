@@ -1,2 +1,12 @@
 class BadOperandException(Exception):
+    pass
+
+
+class BadExpressionException(Exception):
+    def __init__(self, message="Couldn't parse expression", position=None):
+        super().__init__(message if position is None else "{} at position {}".format(message, position))
+        self.position = position
+
+
+class EvaluationException(Exception):
     pass
\ No newline at end of file
@@ -9,169 +9,286 @@
 
 """
 
-from . import advanced, basic, stack
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import advanced, angles, basic, cache, compiler, numeric, optimizer, stack, tokenizer
+from . import exceptions as e
 
 LEFT_PAR = "("
 RIGHT_PAR = ")"
 
+"""! Codes of the operators on the OperatorStack of postfix(), functions have the largest codes """
+OPEN = 0
+ADD = 1
+SUB = 2
+MUL = 3
+DIV = 4
+POW = 5
+NEG = 6
+SIN = 7
+COS = 8
+TAN = 9
+CTG = 10
+FACTORIAL = 11
+LOG = 12
+ROOT = 13
+
+"""! Operators and functions by code, compiler.NEGATE is the unary minus """
+NAMES = (LEFT_PAR, '+', '-', '×', '÷', '^', compiler.NEGATE,
+         'sin', 'cos', 'tan', 'ctg', tokenizer.FACTORIAL, 'log', 'sqrt')
+
+"""! Codes of the tokens, unary minus is the token "-" at the place of an operand """
+CODES = {name: code for code, name in enumerate(NAMES) if code != NEG}
+
+"""! Precedences by code, "(" has the lowest one, so it stops reductions """
+PRECEDENCES = (0, 1, 1, 2, 2, 3, 4, 5, 5, 5, 5, 5, 5, 5)
+
+"""! Functions by code """
+CALLS = (None,) * SIN + tuple(compiler.UNARY_OPERATIONS.get(op) or compiler.OPERATIONS[op] for op in NAMES[SIN:])
+
+"""! Math libraries have no state, so they are shared by all parsers """
+_ADVANCED = advanced.Advanced()
+_BASIC = basic.Basic()
+
+"""! Parsers of the threads, see shared_parser() """
+_local = threading.local()
+
 
 class MathParsing:
     """!
     @brief Base class "MathParsing", representation of basic math logic
     """
 
-    def __init__(self):
+    def __init__(self, backend=None):
+        """!
+            @param backend Numeric backend from numeric.py used by parse(), numeric.FLOAT if None
+        """
+
         self.operators = {'+': 1, '-': 1, '×': 2, '÷': 2, '^': 3}
-        self.adv = advanced.Advanced()
-        self.basic = basic.Basic()
+        self.numbers = backend or numeric.FLOAT
+        if self.numbers is numeric.FLOAT:
+            self.adv = _ADVANCED
+            self.basic = _BASIC
+        else:
+            self.adv = advanced.Advanced(self.numbers)
+            self.basic = basic.Basic(self.numbers)
         self.tokens = []
-        self.operator_stack = stack.Stack()
+        self.error = None
         self.operand_stack = stack.Stack()
+        self.number_stack = stack.NumberStack()
+        self.code_stack = stack.OperatorStack()
+
+    def reset(self):
+        """! @brief Method for clearing the state left by the last expression, so the parser can be reused """
+
+        self.tokens.clear()
+        self.error = None
+        self.operand_stack.clear()
+        self.number_stack.clear()
+        self.code_stack.clear()
 
     def split_expression(self, expression: str):
         """!
-            @brief Method for splitting an expression into tokens
+            @brief Method for splitting an expression into tokens, the expression is checked at the same time
             @param expression Expression string
         """
 
-        number = ""
-        for char in expression:
-            if char.isnumeric() or char == ".":
-                number += char
-            elif char == RIGHT_PAR or char == LEFT_PAR or char in self.operators:
-                if len(number) != 0:
-                    self.tokens.append(number)
-                    number = ""
-                self.tokens.append(char)
-            elif char == "e":
-                self.tokens.append(str(self.basic.exp))
-            elif char == "π":
-                self.tokens.append(str(self.basic.pi))
-        if number != "":
-            self.tokens.append(number)
+        self.error = None
+        try:
+            for token in tokenizer.tokenize(expression, self.numbers.constants):
+                self.tokens.append(token.text)
+        except e.BadExpressionException as error:
+            self.error = error
 
     def check_semantics(self):
         """!
-            @brief Method for checking if the expression is correct
-            @return True if expression is correct, False instead
+            @brief Method for checking if the split expression is correct
+            @return True if expression is correct, False instead, the first error with its offset is in self.error
         """
 
-        """! Parentheses balance checking """
-        pars = []
-        for token in self.tokens:
-            if token == LEFT_PAR:
-                pars.append(token)
-            elif token == RIGHT_PAR:
-                if not pars:
-                    return False
-                pars.pop()
-        if pars:
-            return False
+        return self.error is None
 
-        """! Checking if the operators are used correctly """
-        prev_token = None
-        for token in self.tokens:
-            if prev_token is None:
-                prev_token = token
-            elif token in self.operators:
-                if prev_token in self.operators:
-                    return False
-                elif prev_token == LEFT_PAR and token != "-":
-                    return False
-                prev_token = token
-            elif token == LEFT_PAR:
-                if prev_token == LEFT_PAR or prev_token in self.operators:
-                    prev_token = token
-                else:
-                    return False
-            else:
-                prev_token = token
+    def compile(self, expression: str, optimize: bool = False):
+        """!
+            @brief Method for compiling an expression, so it can be evaluated many times without parsing
+            @param expression Expression string
+            @param optimize Fold constants and remove identities, see optimizer.py
+            @return Immutable compiler.CompiledExpression object
+            @exception BadExpressionException Expression is not correct
+        """
 
-        if self.tokens[-1] in self.operators or self.tokens[-1] == LEFT_PAR:
-            return False
+        self.tokens = []
+        try:
+            self.split_expression(expression)
+            if self.check_semantics() is False:
+                raise self.error
+            if len(self.tokens) == 0:
+                raise e.BadExpressionException("Empty expression", 0)
+            tree = self.build_tree(self.tokens)
+            if optimize:
+                tree = optimizer.fold(tree)
+        finally:
+            self.tokens = []
+
+        return compiler.CompiledExpression(expression, tree)
+
+    def postfix(self, tokens: list):
+        """!
+            @brief Generator of the tokens in postfix order (shunting-yard), the grammar of all evaluation modes
+            @param tokens List of tokens
+            @return Generator of operands (number and variable tokens) and int codes of operators and functions
+            @exception BadExpressionException Tokens don't form an expression
+
+            @par
+            Pending operators are kept on the OperatorStack as codes. An operator
+            is generated as soon as the next token allows it, so the consumer can
+            apply it immediately. Factorial is generated right after its operand.
+        """
 
-        """! Checking the number format and possible negative numbers """
-        prev_token = None
-        for token in self.tokens:
-            if prev_token is None:
-                prev_token = token
-            elif token in self.operators:
-                if prev_token in self.operators:
-                    return False
-                elif prev_token == LEFT_PAR and token != "-":
-                    return False
-                prev_token = token
-            elif token == LEFT_PAR:
-                if prev_token == LEFT_PAR or prev_token in self.operators:
-                    prev_token = token
-                else:
-                    return False
+        operators = self.code_stack.reserve(len(tokens))
+        level = -1
+        expect_operand = True
+        for index, token in enumerate(tokens):
+            code = CODES.get(token)
+            if code is None and token != RIGHT_PAR:
+                if not expect_operand:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                yield token
+                expect_operand = False
+            elif code is None:
+                if expect_operand:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                while level >= 0 and operators[level] != OPEN:
+                    yield operators[level]
+                    level -= 1
+                if level < 0:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                level -= 1
+                if level >= 0 and operators[level] >= SIN:
+                    """! The first argument of log and sqrt is followed by the second one """
+                    if operators[level] >= LOG and tokens[index + 1:index + 2] == [LEFT_PAR]:
+                        expect_operand = True
+                    else:
+                        yield operators[level]
+                        level -= 1
+            elif code == FACTORIAL:
+                if expect_operand:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                yield code
+            elif code == OPEN or code >= SIN:
+                if not expect_operand:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                level += 1
+                operators[level] = code
+            elif expect_operand:
+                if code != SUB:
+                    raise e.BadExpressionException("Couldn't parse expression")
+                level += 1
+                operators[level] = NEG
             else:
-                prev_token = token
+                precedence = PRECEDENCES[code]
+                while level >= 0 and PRECEDENCES[operators[level]] >= precedence:
+                    yield operators[level]
+                    level -= 1
+                level += 1
+                operators[level] = code
+                expect_operand = True
+
+        if expect_operand:
+            raise e.BadExpressionException("Couldn't parse expression")
+        while level >= 0:
+            if operators[level] == OPEN:
+                raise e.BadExpressionException("Couldn't parse expression")
+            yield operators[level]
+            level -= 1
+
+    def build_tree(self, tokens: list):
+        """!
+            @brief Method for building the expression tree from checked tokens
+            @param tokens List of tokens
+            @return Root node of the expression tree
+            @exception BadExpressionException Tokens don't form an expression
+        """
 
-        if self.tokens[-1] in self.operators or self.tokens[-1] == LEFT_PAR:
-            return False
+        operands = []
+        for item in self.postfix(tokens):
+            if isinstance(item, str):
+                operands.append(compiler.variable(item) if item.isidentifier() else compiler.number(item))
+            elif NAMES[item] in compiler.UNARY_OPERATIONS:
+                operands.append(compiler.operation(NAMES[item], operands.pop()))
+            else:
+                operand2 = operands.pop()
+                operands.append(compiler.operation(NAMES[item], operands.pop(), operand2))
 
-        """! Checking the number format and possible negative numbers """
-        prev_token = None
-        index = 0
-        for token in self.tokens:
-            if prev_token is None:
-                prev_token = token
-                if prev_token == "-" and self.tokens[index + 1][0].isnumeric():
-                    if self.tokens[index + 1] == ".":
-                        return False
-                    if "." in self.tokens[index + 1]:
-                        count = 0
-                        for c in self.tokens[index + 1]:
-                            if c == ".":
-                                count += 1
-                        if count > 1:
-                            return False
-                    if len(self.tokens[index + 1]) >= 2:
-                        if self.tokens[index + 1][0] == "0" and self.tokens[index + 1][1] != ".":
-                            return False
-                    self.tokens[index] += self.tokens[index + 1]
-                    del self.tokens[index + 1]
-            if token not in self.operators and token != RIGHT_PAR and token != LEFT_PAR:
-                if token[0] == ".":
-                    return False
-                if "." in token:
-                    count = 0
-                    for c in token:
-                        if c == ".":
-                            count += 1
-                    if count > 1:
-                        return False
-                if len(token) >= 2:
-                    if token[0] == "0" and token[1] != ".":
-                        return False
-                if prev_token == "-":
-                    if self.tokens[index - 2] == LEFT_PAR:
-                        self.tokens[index - 1] += self.tokens[index]
-                        del self.tokens[index]
-            index += 1
-            prev_token = token
-
-        return True
+        return operands[0]
 
     def parse(self, expression: str):
         """!
-            @brief Main method for parsing the expression using stack.py module
+            @brief Main method for parsing the expression, results are looked up in the cache if it is enabled
             @param expression Expression string from app.py module
             @return Result string of the expression or error message
+
+            @par
+            Only results of the float backend are cached, the cache is shared by
+            all parsers of the process.
+        """
+
+        expression = cache.normalize(expression)
+        results = cache.current()
+        if results is None or self.numbers is not numeric.FLOAT:
+            return self.parse_expression(expression)
+
+        result = results.get(expression)
+        if result is None:
+            result = self.parse_expression(expression)
+            results.put(expression, result)
+        return result
+
+    def parse_expression(self, expression: str):
+        """!
+            @brief Method for parsing the expression using stack.py module
+            @param expression Normalized expression string
+            @return Result string of the expression or error message, the parser is reset in both cases
+        """
+
+        try:
+            with self.numbers.context():
+                if self.numbers.deferred:
+                    return self.evaluate_deferred(expression)
+                return self.evaluate_tokens(expression)
+        finally:
+            self.reset()
+
+    def evaluate_tokens(self, expression: str):
+        """!
+            @brief Method for splitting and evaluating the expression on the operand stack of the parser
+            @param expression Normalized expression string
+            @return Result string of the expression or error message
+        """
+
+        error = self.check_tokens(expression)
+        if error is not None:
+            return error
+
+        try:
+            for item in self.postfix(self.tokens):
+                if isinstance(item, str):
+                    self.operand_stack.push(item)
+                elif self.reduce(NAMES[item]) is False:
+                    return "Couldn't parse expression"
+        except e.BadExpressionException:
+            return "Couldn't parse expression"
+
+        return self.numbers.output(self.operand_stack.top())
+
+    def check_tokens(self, expression: str):
+        """!
+            @brief Method for splitting the expression and checking if it can be evaluated
+            @param expression Normalized expression string
+            @return Error message or None if the tokens of the expression are correct
         """
 
-        if len(expression) > 3 and expression[0:3] == "log":
-            result, index = self.parse_advanced("log", expression)
-            if result == "":
-                return "Couldn't parse expression"
-            expression = expression.replace(expression[:index], result)
-        if len(expression) > 4 and expression[0:4] == "sqrt":
-            result, index = self.parse_advanced("sqrt", expression)
-            if result == "":
-                return "Couldn't parse expression"
-            expression = expression.replace(expression[:index], result)
         if len(expression) == 0:
             return "Enter math expression"
 
@@ -180,139 +297,108 @@ class MathParsing:
         if self.check_semantics() is False:
             return "Couldn't parse expression"
 
-        """! Start parsing an expression """
+        """! Variables can be used only in compiled expressions """
         for token in self.tokens:
-            if token not in self.operators and token != LEFT_PAR and token != RIGHT_PAR:
-                self.operand_stack.push(token)
-            elif token == LEFT_PAR:
-                self.operator_stack.push(token)
-            elif token == RIGHT_PAR:
-                while not self.operator_stack.top() == LEFT_PAR:
-                    operand2 = float(self.operand_stack.pop())
-                    operand1 = float(self.operand_stack.pop())
-                    if self.evaluate(operand1, operand2) is False:
-                        return "Couldn't parse expression"
-                if not self.operator_stack.is_empty() and self.operator_stack.top() == LEFT_PAR:
-                    self.operator_stack.pop()
-            elif token in self.operators:
-                if self.operator_stack.is_empty():
-                    self.operator_stack.push(token)
-                else:
-                    top = self.operator_stack.top()
-                    if top == LEFT_PAR:
-                        self.operator_stack.push(token)
-                    elif self.operators[token] > self.operators[top]:
-                        self.operator_stack.push(token)
-                    else:
-                        operand2 = float(self.operand_stack.pop())
-                        operand1 = float(self.operand_stack.pop())
-                        if self.evaluate(operand1, operand2) is False:
-                            return "Couldn't parse expression"
+            if token.isidentifier() and token not in tokenizer.FUNCTIONS:
+                return "Couldn't parse expression"
 
-                        self.operator_stack.push(token)
+        return None
 
-        while not self.operator_stack.is_empty():
-            operand2 = float(self.operand_stack.pop())
-            operand1 = float(self.operand_stack.pop())
-            if self.evaluate(operand1, operand2) is False:
-                return "Couldn't parse expression"
+    def evaluate_deferred(self, expression: str):
+        """!
+            @brief Method for evaluating the expression on raw doubles, see numeric.DoubleBackend
+            @param expression Normalized expression string
+            @return Result string of the expression or error message
 
-        self.tokens = []
+            @par
+            Numbers are converted to floats once, when they are pushed on the
+            NumberStack, and only the final result is rounded by the backend. The
+            stack is reserved for the number of tokens and used by index, so
+            there are no method calls per token. Functions are applied by the
+            compiler functions, which round their own results.
+        """
+
+        error = self.check_tokens(expression)
+        if error is not None:
+            return error
+
+        numbers = self.number_stack.reserve(len(self.tokens))
+        reduce = self.reduce_deferred
+        top = -1
+        try:
+            for item in self.postfix(self.tokens):
+                if isinstance(item, str):
+                    top += 1
+                    numbers[top] = float(item)
+                else:
+                    top = reduce(numbers, top, item)
+        except (e.BadExpressionException, e.EvaluationException, ArithmeticError):
+            return "Couldn't parse expression"
 
-        return str(self.operand_stack.top())
+        return self.numbers.output(numbers[top])
 
-    def parse_advanced(self, func, expression):
+    @staticmethod
+    def reduce_deferred(numbers, top: int, code: int) -> int:
         """!
-            @brief Main method for parsing the expression using stack.py module
-            @param func Function name (log or sqrt)
-            @param expression Expression to evaluate
-            @return Result of the parsing. Result is "" if error occurred
+            @brief Method for applying an operator or function to the raw doubles on top of the number array
+            @param numbers Array of the NumberStack
+            @param top Index of the top number
+            @param code Code of the operator or function
+            @return Index of the top number after the operation, the result is on top
+            @exception EvaluationException Division by zero, non-integer exponent or wrong function operand
+            @exception ArithmeticError Zero to a negative power or overflow
         """
 
-        if func == "sqrt":
-            result = ""
-            degree = ""
-            base = ""
-            start = None
-            par_count = 0
-            for char in expression[4:]:
-                if char == LEFT_PAR:
-                    par_count += 1
-                if char == RIGHT_PAR:
-                    par_count -= 1
-
-                degree += char
-
-                if char == RIGHT_PAR and par_count == 0:
-                    index = expression.index(char)
-                    start = char
-                    break
-
-            par_count = 0
-            if start == RIGHT_PAR:
-                index_end = index + 1
-                for char in expression[index + 1:]:
-                    if char == LEFT_PAR:
-                        par_count += 1
-                    if char == RIGHT_PAR:
-                        par_count -= 1
-
-                    base += char
-                    index_end += 1
-
-                    if char == RIGHT_PAR and par_count == 0:
-                        break
-
-            if degree != "()" and base != "()":
-                degree_res = self.parse(degree)
-                base_res = self.parse(base)
-
-                if base_res != "Couldn't parse expression" and degree_res != "Couldn't parse expression":
-                    if degree_res.isnumeric():
-                        result = self.adv.rootn(int(degree_res), float(base_res))
+        if code == NEG:
+            numbers[top] = -numbers[top]
+            return top
+        if SIN <= code < LOG:
+            numbers[top] = CALLS[code](numbers[top])
+            return top
+
+        operand2 = numbers[top]
+        top -= 1
+        operand1 = numbers[top]
+        if code == ADD:
+            numbers[top] = operand1 + operand2
+        elif code == SUB:
+            numbers[top] = operand1 - operand2
+        elif code == MUL:
+            numbers[top] = operand1 * operand2
+        elif code == DIV:
+            if operand2 == 0:
+                raise e.EvaluationException("Division by zero")
+            numbers[top] = operand1 / operand2
+        elif code == POW:
+            if not operand2.is_integer():
+                raise e.EvaluationException("Exponent is not an integer")
+            numbers[top] = pow(operand1, operand2)
         else:
-            result = ""
-            degree = ""
-            base = ""
-            start = None
-            par_count = 0
-            for char in expression[3:]:
-                if char == LEFT_PAR:
-                    par_count += 1
-                if char == RIGHT_PAR:
-                    par_count -= 1
-
-                degree += char
-
-                if char == RIGHT_PAR and par_count == 0:
-                    index = expression.index(char)
-                    start = char
-                    break
-
-            par_count = 0
-            if start == RIGHT_PAR:
-                index_end = index + 1
-                for char in expression[index + 1:]:
-                    if char == LEFT_PAR:
-                        par_count += 1
-                    if char == RIGHT_PAR:
-                        par_count -= 1
-
-                    base += char
-                    index_end += 1
-
-                    if char == RIGHT_PAR and par_count == 0:
-                        break
-
-            if degree != "()" and base != "()":
-                degree_res = self.parse(degree)
-                base_res = self.parse(base)
-
-                if base_res != "Couldn't parse expression" and degree_res != "Couldn't parse expression":
-                    if degree_res.isnumeric():
-                        result = self.adv.logarithm(float(base_res), int(degree_res))
-
-        return str(result), index_end
+            numbers[top] = CALLS[code](operand1, operand2)
+        return top
+
+    def reduce(self, op: str):
+        """!
+            @brief Method for applying an operator or function to the operands on top of the operand stack
+            @param op Operator, compiler.NEGATE or function
+            @return False if error occurred
+        """
+
+        try:
+            if op in self.operators:
+                operand2 = self.numbers.number(self.operand_stack.pop())
+                operand1 = self.numbers.number(self.operand_stack.pop())
+                return self.evaluate(op, operand1, operand2)
+
+            if op in compiler.UNARY_OPERATIONS:
+                result = compiler.UNARY_OPERATIONS[op](float(self.numbers.number(self.operand_stack.pop())))
+            else:
+                operand2 = float(self.numbers.number(self.operand_stack.pop()))
+                result = compiler.OPERATIONS[op](float(self.numbers.number(self.operand_stack.pop())), operand2)
+            result = self.numbers.normalize(result)
+        except (e.EvaluationException, ArithmeticError, ValueError):
+            return False
+        self.operand_stack.push(result)
 
     def parse_factorial(self, expression):
         """!
@@ -321,18 +407,7 @@ class MathParsing:
             @return Result of the evaluating
         """
 
-        expression_evaluate = ""
-        for char in expression:
-            expression_evaluate += char
-
-        parse_result = self.parse(expression_evaluate)
-        if parse_result.isnumeric():
-            if int(parse_result) > 0:
-                result = self.adv.factorial(int(parse_result))
-        else:
-            result = "Couldn't parse expression"
-
-        return str(result)
+        return self.parse("({})!".format(expression))
 
     def parse_trigonometry(self, func, expression):
         """!
@@ -340,34 +415,37 @@ class MathParsing:
             @param func Trigonometric function
             @param expression Expression to evaluate
             @return Result of the evaluating
-        """
-
-        expression_evaluate = ""
-        for char in expression:
-            expression_evaluate += char
 
-        parse_result = float(self.parse(expression_evaluate))
-        match func:
-            case "sin":
-                result = self.adv.sinus(parse_result)
-            case "cos":
-                result = self.adv.cosines(parse_result)
-            case "tan":
-                result = self.adv.tang(parse_result)
-            case "ctg":
-                result = self.adv.cotg(parse_result)
+            @par
+            A plain number is not parsed at all, other arguments are parsed
+            alone (so the argument is cached once for all functions) and the
+            function is applied to the result by angles.value, without building
+            and parsing the whole call.
+        """
 
-        return str(result)
+        try:
+            tokens = list(tokenizer.tokenize(expression))
+        except e.BadExpressionException:
+            return "Couldn't parse expression"
+        try:
+            if len(tokens) == 1 and tokens[0].kind == tokenizer.NUMBER:
+                angle = float(tokens[0].text)
+            else:
+                angle = float(self.parse(expression))
+            return str(angles.value(func, angle))
+        except (ValueError, OverflowError, ZeroDivisionError, KeyError):
+            return "Couldn't parse expression"
 
-    def evaluate(self, operand1, operand2):
+    def evaluate(self, op: str, operand1, operand2):
         """!
             @brief Method for evaluation of single math expressions using math libraries
+            @param op Operator
             @param operand1 First operand
             @param operand2 Second operand
             @return False if error occurred
         """
 
-        match self.operator_stack.pop():
+        match op:
             case "-":
                 result = self.basic.sub(operand1, operand2)
             case "+":
@@ -380,11 +458,51 @@ class MathParsing:
                 except ZeroDivisionError:
                     return False
             case "^":
-                if operand2.is_integer():
+                if not self.numbers.is_integer(operand2):
+                    return False
+                try:
                     result = self.adv.power(operand1, operand2)
-                else:
+                except ArithmeticError:
+                    """! Zero to a negative power, float overflow or decimal.Overflow of the decimal backend """
                     return False
 
         self.operand_stack.push(result)
 
 
+def shared_parser():
+    """!
+        @brief Function for getting the parser of the current thread, it is created on the first call
+        @return MathParsing object, which is reset after every parsed expression
+    """
+
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = MathParsing()
+    return parser
+
+
+def evaluate(expression: str) -> str:
+    """!
+        @brief Thread-safe function for parsing an expression
+        @param expression Expression string
+        @return Result string of the expression or error message
+
+        @par
+        The state of the call lives in the parser of the calling thread and it
+        is reset before the function returns, so no state is shared between
+        threads or left for the next call. The result cache is locked.
+    """
+
+    return shared_parser().parse(expression)
+
+
+def evaluate_concurrently(expressions, max_workers: int = None) -> list:
+    """!
+        @brief Function for parsing expressions on a thread pool
+        @param expressions Iterable of expression strings
+        @param max_workers Number of threads, default of ThreadPoolExecutor if None
+        @return List of result strings in the order of the expressions
+    """
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(evaluate, expressions))
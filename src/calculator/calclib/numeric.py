@@ -0,0 +1,318 @@
+"""!
+    @file numeric.py
+
+    @brief Numeric backends of the math libraries: floats, fractions and decimals
+
+    @date 17.10.2026
+
+    @par
+    A backend decides the type of numbers used by Basic, Advanced and
+    MathParsing, how every result is normalized and how the final result is
+    written. FLOAT is the original calculator: every operation is rounded to 7
+    decimal places and π and e are 3.1416 and 2.7183. DoubleBackend has the
+    same constants, but it keeps raw doubles and rounds only the final
+    result, MathParsing evaluates it without the Stack objects and the Basic
+    methods (see MathParsing.evaluate_deferred). FractionBackend keeps
+    exact rationals and DecimalBackend computes in a decimal.Context with the
+    configured precision, both round only the final result to the given number
+    of decimal places. Functions (sin, log, sqrt, ...) are computed in floats
+    by every backend, their results are converted back to the backend numbers.
+"""
+
+import contextlib
+import decimal
+import math
+from fractions import Fraction
+
+from . import basic
+
+
+def real(value):
+    """!
+        @brief Function for dropping the imaginary part of a result (odd roots of negative numbers)
+        @param value Number
+        @return Real part of a complex number, other numbers are returned unchanged
+    """
+
+    return value.real if isinstance(value, complex) else value
+
+
+class FloatBackend:
+    """!
+        @brief Class "FloatBackend", floats rounded after every operation
+    """
+
+    name = "float"
+    pi = basic.Basic.pi
+    exp = basic.Basic.exp
+
+    """! MathParsing evaluates deferred backends by evaluate_deferred() on raw doubles """
+    deferred = False
+
+    """! Conversion of number strings and results of functions """
+    number = float
+
+    """! Check of integer exponents """
+    is_integer = staticmethod(float.is_integer)
+
+    def __init__(self):
+        self.constants = {"e": str(self.exp), "π": str(self.pi)}
+
+    @staticmethod
+    def normalize(value):
+        """!
+            @brief Method for normalizing the result of an operation
+            @param value Result
+            @return Result rounded to 7 decimal places, integers are int
+        """
+
+        return basic.Basic.int_translate(value)
+
+    @staticmethod
+    def output(value) -> str:
+        """!
+            @brief Method for writing the final result, it is already rounded
+            @param value Result
+            @return Result string, error message for integers too long for str() (large factorials)
+        """
+
+        try:
+            return str(value)
+        except ValueError:
+            return "Couldn't parse expression"
+
+    @staticmethod
+    def context():
+        """!
+            @brief Method for getting the context manager of an evaluation
+            @return Context manager, which does nothing for floats
+        """
+
+        return contextlib.nullcontext()
+
+
+class DoubleBackend(FloatBackend):
+    """!
+        @brief Class "DoubleBackend", raw doubles, only the final result is rounded
+    """
+
+    name = "double"
+    deferred = True
+
+    @staticmethod
+    def normalize(value):
+        """!
+            @brief Method for normalizing the result of an operation, doubles are kept as they are
+            @param value Result
+            @return The same value
+        """
+
+        return value
+
+    @staticmethod
+    def output(value) -> str:
+        """!
+            @brief Method for writing the final result, the only rounding
+            @param value Result
+            @return Result rounded to 7 decimal places, integers without decimal places
+        """
+
+        return str(basic.Basic.int_translate(value))
+
+
+class FractionBackend(FloatBackend):
+    """!
+        @brief Class "FractionBackend", exact rational arithmetic
+    """
+
+    name = "fraction"
+    pi = Fraction(repr(math.pi))
+    exp = Fraction(repr(math.e))
+
+    def __init__(self, places: int = 7):
+        """!
+            @param places Number of decimal places of the final result, the exact fraction is written if None
+        """
+
+        super().__init__()
+        self.places = places
+        self.constants = {"e": str(self.exp), "π": str(self.pi)}
+
+    @staticmethod
+    def number(value) -> Fraction:
+        """!
+            @brief Method for converting a number string or a number
+            @param value Number string (decimal or "a/b") or number
+            @return Fraction, floats are converted by their shortest decimal representation
+        """
+
+        value = real(value)
+        return Fraction(repr(value) if isinstance(value, float) else value)
+
+    @staticmethod
+    def is_integer(value) -> bool:
+        """!
+            @brief Method for checking if a number is an integer
+            @param value Fraction
+            @return True if the denominator is 1
+        """
+
+        return value.denominator == 1
+
+    def normalize(self, value):
+        """!
+            @brief Method for normalizing the result of an operation, fractions are kept exact
+            @param value Result
+            @return Fraction, results of float functions are converted by number()
+        """
+
+        return value if isinstance(value, (Fraction, int)) else self.number(value)
+
+    def output(self, value) -> str:
+        """!
+            @brief Method for writing the final result, the only rounding
+            @param value Fraction
+            @return Result string in positional notation, integers without decimal places,
+                    error message for numbers too long for str() (large factorials)
+        """
+
+        value = self.number(value)
+        try:
+            if value.denominator == 1:
+                return str(value.numerator)
+            if self.places is None:
+                return str(value)
+            value = round(value, self.places)
+            if value.denominator == 1:
+                return str(value.numerator)
+            """! The denominator divides 10 ** places, so the scaled numerator is exact """
+            scaled = abs(value.numerator) * 10 ** self.places // value.denominator
+            digits = str(scaled).rjust(self.places + 1, "0")
+            sign = "-" if value < 0 else ""
+            return "{}{}.{}".format(sign, digits[:-self.places], digits[-self.places:].rstrip("0"))
+        except ValueError:
+            return "Couldn't parse expression"
+
+
+class DecimalBackend(FloatBackend):
+    """!
+        @brief Class "DecimalBackend", decimal arithmetic in a configurable context
+    """
+
+    name = "decimal"
+
+    def __init__(self, context: decimal.Context = None, places: int = 7):
+        """!
+            @param context decimal.Context of the operations, 28 digits by default
+            @param places Number of decimal places of the final result, all digits are written if None
+        """
+
+        super().__init__()
+        self.decimals = context or decimal.Context(prec=28)
+        self.places = places
+        self.pi = self.compute_pi()
+        self.exp = self.decimals.exp(1)
+        self.constants = {"e": str(self.exp), "π": str(self.pi)}
+
+    def compute_pi(self) -> decimal.Decimal:
+        """!
+            @brief Method for computing π with the precision of the context (series from the decimal documentation)
+            @return π rounded to the context
+        """
+
+        with decimal.localcontext(self.decimals) as local:
+            local.prec += 2
+            three = decimal.Decimal(3)
+            last, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+            while s != last:
+                last = s
+                n, na = n + na, na + 8
+                d, da = d + da, da + 32
+                t = (t * n) / d
+                s += t
+        return self.decimals.plus(s)
+
+    def number(self, value) -> decimal.Decimal:
+        """!
+            @brief Method for converting a number string or a number
+            @param value Number string or number
+            @return Decimal rounded to the context, floats are converted by their shortest decimal representation
+        """
+
+        value = real(value)
+        return self.decimals.create_decimal(repr(value) if isinstance(value, float) else value)
+
+    @staticmethod
+    def is_integer(value) -> bool:
+        """!
+            @brief Method for checking if a number is an integer
+            @param value Decimal
+            @return True if the number has no fractional part
+        """
+
+        return value == value.to_integral_value()
+
+    def normalize(self, value):
+        """!
+            @brief Method for normalizing the result of an operation
+            @param value Result
+            @return Decimal rounded to the context
+            @exception ArithmeticError The result is infinite (zero to a negative power) or NaN
+        """
+
+        value = self.decimals.plus(value) if isinstance(value, decimal.Decimal) else self.number(value)
+        if not value.is_finite():
+            raise ArithmeticError("Result is not finite")
+        return value
+
+    def output(self, value) -> str:
+        """!
+            @brief Method for writing the final result, the only rounding
+            @param value Decimal
+            @return Result string in positional notation, integers without decimal places,
+                    error message for numbers too long for str() (large factorials)
+        """
+
+        value = self.number(value)
+        try:
+            if value == value.to_integral_value():
+                return str(int(value))
+        except ValueError:
+            return "Couldn't parse expression"
+        if self.places is not None:
+            exponent = decimal.Decimal(1).scaleb(-self.places)
+            value = value.quantize(exponent, context=decimal.Context(prec=max(value.adjusted(), 0) + self.places + 2))
+        return format(value.normalize(), "f")
+
+    def context(self):
+        """!
+            @brief Method for getting the context manager of an evaluation
+            @return decimal.localcontext with the context of the backend
+        """
+
+        return decimal.localcontext(self.decimals)
+
+
+"""! Default backend of the calculator """
+FLOAT = FloatBackend()
+
+"""! Backends by name, see backend() """
+BACKENDS = {"float": FloatBackend, "double": DoubleBackend, "fraction": FractionBackend, "decimal": DecimalBackend}
+
+
+def backend(name: str, **options):
+    """!
+        @brief Function for creating a backend by name
+        @param name "float", "double", "fraction" or "decimal"
+        @param options Arguments of the backend class (places, context)
+        @return Backend object, FLOAT for "float" without options
+        @exception ValueError Unknown backend
+    """
+
+    try:
+        cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError("Unknown numeric backend {}".format(name)) from None
+    if cls is FloatBackend and not options:
+        return FLOAT
+    return cls(**options)
@@ -0,0 +1,123 @@
+"""!
+    @file numpy_backend.py
+
+    @brief Evaluation of compiled expressions over whole NumPy arrays
+
+    @date 17.10.2026
+
+    @par
+    NumPy is an optional dependency, the module can be imported without it,
+    but evaluate_columns() raises ImportError then.
+"""
+
+from . import compiler, vector
+from . import exceptions as e
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+"""! Binary operators supported by the backend, functions are not vectorized """
+OPERATORS = ('+', '-', '×', '÷', '^')
+
+
+def available() -> bool:
+    """!
+        @brief Function for checking if NumPy is installed
+        @return True if the backend can be used
+    """
+
+    return numpy is not None
+
+
+def divide(divident, divisor, errors):
+    """!
+        @brief Element-wise division, rows with zero divisor are marked in the error mask
+        @param divident Array of numbers to be divided
+        @param divisor Array of numbers to divide by
+        @param errors Boolean error mask, updated in place
+        @return Array of results
+    """
+
+    zero = divisor == 0
+    errors |= zero
+    return vector.int_translate(divident / numpy.where(zero, 1, divisor))
+
+
+def power(base, exponent, errors):
+    """!
+        @brief Element-wise exponentiation, rows with non-integer exponent are marked in the error mask
+        @param base Array of base numbers
+        @param exponent Array of exponent numbers
+        @param errors Boolean error mask, updated in place
+        @return Array of results
+    """
+
+    with numpy.errstate(all="ignore"):
+        bad = (exponent != numpy.floor(exponent)) | ((base == 0) & (exponent < 0))
+        errors |= bad
+        return vector.int_translate(numpy.power(base, numpy.where(bad, 1, exponent)))
+
+
+def evaluate_columns(compiled: compiler.CompiledExpression, columns: dict, size: int = None):
+    """!
+        @brief Function for evaluating a compiled expression over columns of variable values
+        @param compiled Compiled expression
+        @param columns Dictionary of arrays (or sequences) with values of the variables
+        @param size Number of rows, needed only if the expression has no variables
+        @return Tuple of the result array and the boolean error mask, results of the bad rows are NaN
+        @exception ImportError NumPy is not installed
+        @exception EvaluationException Unbound variable or function in the expression
+    """
+
+    if numpy is None:
+        raise ImportError("NumPy backend requires numpy to be installed")
+
+    try:
+        arrays = [numpy.asarray(columns[name], dtype=numpy.float64) for name in compiled.variables]
+    except KeyError as error:
+        raise e.EvaluationException("Unbound variable {}".format(error.args[0])) from None
+    if size is None:
+        size = len(arrays[0]) if arrays else 1
+    for array in arrays:
+        if array.shape != (size,):
+            raise ValueError("Columns have different lengths")
+
+    errors = numpy.zeros(size, dtype=bool)
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    shared = [None] * compiled.shared
+    with numpy.errstate(all="ignore"):
+        for op, value in compiled.program:
+            if op == compiler.NUMBER:
+                push(numpy.full(size, value))
+            elif op == compiler.VARIABLE:
+                push(arrays[value])
+            elif op == compiler.SHARED:
+                push(shared[value])
+            elif op == compiler.STORE:
+                shared[value] = stack[-1]
+            elif op == compiler.NEGATE:
+                push(vector.int_translate(-pop()))
+            elif op not in OPERATORS:
+                raise e.EvaluationException("Function {} is not supported by the NumPy backend".format(op))
+            else:
+                operand2 = pop()
+                operand1 = pop()
+                if op == '+':
+                    push(vector.int_translate(operand1 + operand2))
+                elif op == '-':
+                    push(vector.int_translate(operand1 - operand2))
+                elif op == '×':
+                    push(vector.int_translate(operand1 * operand2))
+                elif op == '÷':
+                    push(divide(operand1, operand2, errors))
+                elif op == '^':
+                    push(power(operand1, operand2, errors))
+
+        result = vector.int_translate(stack[-1])
+        errors |= ~numpy.isfinite(result)
+
+    return numpy.where(errors, numpy.nan, result), errors
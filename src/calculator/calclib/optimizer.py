@@ -0,0 +1,169 @@
+"""!
+    @file optimizer.py
+
+    @brief Optimization pass over expression trees: constant folding and identities
+
+    @date 17.10.2026
+
+    @par
+    Operations with constant operands are evaluated once at compile time by
+    the same functions as at run time, so the rounding of every operation is
+    kept. Operations which fail (division by zero) are left in the tree and
+    fail at evaluation. Trigonometric functions are never folded, they depend
+    on the angle unit at evaluation time (see angles.set_unit). Identities x×1, 1×x, x+0, 0+x, x-0, x÷1 and x^1 are
+    removed only if x is already rounded (it is a result of an operation or a
+    rounded constant) or the operation is the root of the tree, whose result
+    is rounded by CompiledExpression.run anyway.
+"""
+
+import decimal
+
+from . import angles, compiler, tokenizer
+from . import exceptions as e
+
+"""! Operators with the right operand which doesn't change the left one """
+RIGHT_IDENTITIES = {'+': 0, '-': 0, '×': 1, '÷': 1, '^': 1}
+
+"""! Operators with the left operand which doesn't change the right one """
+LEFT_IDENTITIES = {'+': 0, '×': 1}
+
+"""! Largest integer result which is folded, larger integers are exact only as Python integers """
+EXACT_INTEGER = 2 ** 53
+
+
+def is_number(node: compiler.Node, value) -> bool:
+    """!
+        @brief Function for checking if a node is the given number
+        @param node Tree node
+        @param value Number or None
+        @return True if node is a number node with the value
+    """
+
+    return value is not None and node.op == compiler.NUMBER and node.args[0] == value
+
+
+def is_rounded(node: compiler.Node) -> bool:
+    """!
+        @brief Function for checking if the value of a node is rounded like the results of operations
+        @param node Tree node
+        @return True for operations and constants with at most 7 decimal places
+    """
+
+    if node.op == compiler.VARIABLE:
+        return False
+    if node.op == compiler.NUMBER:
+        return node.args[0] == round(node.args[0], 7)
+    return True
+
+
+def simplify(op: str, args: list, root: bool) -> compiler.Node:
+    """!
+        @brief Function for simplifying an operation with already simplified operands
+        @param op Operator
+        @param args Operand nodes
+        @param root True if the operation is the root of the tree
+        @return Simplified tree node
+    """
+
+    if op not in angles.FUNCTIONS and all(arg.op == compiler.NUMBER for arg in args):
+        try:
+            if len(args) == 1:
+                result = compiler.UNARY_OPERATIONS[op](args[0].args[0])
+            else:
+                result = compiler.OPERATIONS[op](args[0].args[0], args[1].args[0])
+            if not isinstance(result, int) or abs(result) <= EXACT_INTEGER:
+                return compiler.number(result)
+        except (e.EvaluationException, ArithmeticError):
+            pass
+    elif len(args) == 2:
+        left, right = args
+        if is_number(right, RIGHT_IDENTITIES.get(op)) and (root or is_rounded(left)):
+            return left
+        if is_number(left, LEFT_IDENTITIES.get(op)) and (root or is_rounded(right)):
+            return right
+
+    return compiler.operation(op, *args)
+
+
+def fold(tree: compiler.Node) -> compiler.Node:
+    """!
+        @brief Function for optimizing an expression tree
+        @param tree Root node of the expression tree
+        @return Root node of the optimized tree, evaluated with the same result
+    """
+
+    results = []
+    nodes = [(tree, False)]
+    while nodes:
+        node, visited = nodes.pop()
+        if node.op == compiler.NUMBER or node.op == compiler.VARIABLE:
+            results.append(node)
+        elif visited:
+            count = len(node.args)
+            args = results[-count:]
+            del results[-count:]
+            results.append(simplify(node.op, args, not nodes))
+        else:
+            nodes.append((node, True))
+            for arg in reversed(node.args):
+                nodes.append((arg, False))
+    return results[0]
+
+
+def optimize(compiled: compiler.CompiledExpression) -> compiler.CompiledExpression:
+    """!
+        @brief Function for optimizing a compiled expression
+        @param compiled CompiledExpression object
+        @return New CompiledExpression object with the optimized tree
+    """
+
+    return compiler.CompiledExpression(compiled.source, fold(compiled.tree))
+
+
+def format_number(value: float) -> str:
+    """!
+        @brief Function for formatting a number of the tree, negative numbers are in parentheses
+        @param value Number
+        @return Number string in positional notation (the tokenizer has no exponents)
+    """
+
+    text = str(int(value)) if value.is_integer() else format(decimal.Decimal(repr(value)), "f")
+    return "({})".format(text) if value < 0 else text
+
+
+def dump(tree: compiler.Node) -> str:
+    """!
+        @brief Function for writing an expression tree as an expression with all parentheses
+        @param tree Root node of the expression tree
+        @return Expression string, it can be compiled again
+    """
+
+    results = []
+    nodes = [(tree, False)]
+    while nodes:
+        node, visited = nodes.pop()
+        if node.op == compiler.NUMBER:
+            results.append(format_number(node.args[0]))
+        elif node.op == compiler.VARIABLE:
+            results.append(node.args[0])
+        elif visited:
+            if node.op == compiler.NEGATE:
+                results.append("(-{})".format(results.pop()))
+            elif node.op == tokenizer.FACTORIAL:
+                results.append("{}!".format(results.pop()))
+            elif node.op in tokenizer.FUNCTIONS:
+                args = results[-len(node.args):]
+                del results[-len(node.args):]
+                results.append(node.op + "".join("({})".format(arg) for arg in args))
+            else:
+                right = results.pop()
+                results.append("({}{}{})".format(results.pop(), node.op, right))
+        else:
+            nodes.append((node, True))
+            for arg in reversed(node.args):
+                nodes.append((arg, False))
+
+    text = results[0]
+    if tree.op in compiler.OPERATIONS and tree.op not in tokenizer.FUNCTIONS:
+        text = text[1:-1]
+    return text
@@ -0,0 +1,65 @@
+"""!
+    @file reader.py
+
+    @brief Memory-mapped reader of files with whitespace-separated numbers
+
+    @date 17.10.2026
+
+    @par
+    The file is memory-mapped and parsed window by window straight into a
+    compact array('d'), so the whole text is never copied into one string and
+    no list with a string for every number is built.
+"""
+
+import mmap
+import re
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+WHITESPACE = re.compile(rb"\s")
+
+
+def map_numbers(path: str, window: int = 1 << 20) -> array:
+    """!
+        @brief Function for reading all numbers of a file into array('d')
+        @param path Path to the file with whitespace-separated numbers
+        @param window Approximate number of bytes parsed at once
+        @return array('d') of the numbers
+    """
+
+    numbers = array('d')
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            """! Empty files can't be mapped """
+            return numbers
+
+        with data:
+            size = len(data)
+            start = 0
+            while start < size:
+                match = WHITESPACE.search(data, min(start + window, size))
+                end = match.start() + 1 if match else size
+                numbers.extend(map(float, data[start:end].split()))
+                start = end
+
+    return numbers
+
+
+def map_array(path: str, window: int = 1 << 20):
+    """!
+        @brief Function for reading all numbers of a file into a NumPy array
+        @param path Path to the file with whitespace-separated numbers
+        @param window Approximate number of bytes parsed at once
+        @return numpy.ndarray of float64 sharing the memory of map_numbers() result
+        @exception ImportError NumPy is not installed
+    """
+
+    if numpy is None:
+        raise ImportError("map_array requires numpy to be installed")
+    return numpy.frombuffer(map_numbers(path, window), dtype=numpy.float64)
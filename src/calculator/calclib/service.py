@@ -0,0 +1,308 @@
+"""!
+    @file service.py
+
+    @brief Asyncio service evaluating newline-delimited expressions and its client
+
+    @date 17.10.2026
+
+    @par
+    Every line received by the server is an expression and it is answered by
+    a line with the result of MathParsing.parse, in the order of the requests
+    of the connection. Requests of all connections are collected into batches,
+    which are evaluated by an executor, so the event loop is never blocked by
+    parsing. Errors are answered per expression, and a batch which isn't
+    evaluated in time is evaluated again expression by expression, so only
+    the slow expressions are answered by an error. The line "#stats" is
+    answered by JSON with latency percentiles.
+    The command line interface is serve.py.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+
+from . import batch
+
+"""! Request answered by the statistics of the service """
+STATS_REQUEST = "#stats"
+
+
+class LatencyRecorder:
+    """!
+        @brief Class "LatencyRecorder", latencies of the last requests and their percentiles
+    """
+
+    def __init__(self, size: int = 10000):
+        self.count = 0
+        self.samples = deque(maxlen=size)
+
+    def record(self, seconds: float):
+        """!
+            @brief Method for adding a latency
+            @param seconds Latency in seconds
+        """
+
+        self.count += 1
+        self.samples.append(seconds)
+
+    def percentiles(self, points=(50, 90, 99)) -> dict:
+        """!
+            @brief Method for computing percentiles of the recorded latencies
+            @param points Percentiles to compute
+            @return Dictionary "p50" -> latency in seconds, empty if nothing is recorded
+        """
+
+        samples = sorted(self.samples)
+        if not samples:
+            return {}
+        return {"p{}".format(point): samples[min(len(samples) - 1, len(samples) * point // 100)] for point in points}
+
+
+class CalculatorService:
+    """!
+        @brief Class "CalculatorService", asyncio server of the calculator
+    """
+
+    def __init__(self, executor=None, batch_size: int = 64, batch_delay: float = 0.0005, timeout: float = 5.0):
+        """!
+            @param executor concurrent.futures executor for evaluation, default executor of the loop if None
+            @param batch_size Maximal number of expressions evaluated at once
+            @param batch_delay Time in seconds for collecting more requests into a batch
+            @param timeout Time in seconds for evaluating a batch or a single expression
+        """
+
+        self.executor = executor
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.timeout = timeout
+        self.latency = LatencyRecorder()
+        self.requests = None
+        self.batcher = None
+        self.server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: str = None):
+        """!
+            @brief Method for starting the server on a TCP port or a Unix socket
+            @param host Host name of the TCP server
+            @param port TCP port, a free port is chosen if 0
+            @param path Path of the Unix socket, TCP is used if None
+            @return asyncio.Server object
+        """
+
+        self.requests = asyncio.Queue()
+        self.batcher = asyncio.create_task(self.run_batches())
+        if path is None:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        else:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        return self.server
+
+    async def close(self):
+        """! @brief Method for stopping the server and the batching task """
+
+        self.server.close()
+        await self.server.wait_closed()
+        self.batcher.cancel()
+        try:
+            await self.batcher
+        except asyncio.CancelledError:
+            pass
+
+    def submit(self, expression: str):
+        """!
+            @brief Method for queueing an expression
+            @param expression Expression string
+            @return asyncio.Future with the result string
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.requests.put_nowait((expression, future, time.perf_counter()))
+        return future
+
+    async def run_batches(self):
+        """! @brief Task collecting queued requests into batches and evaluating them in the executor """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await self.requests.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(requests) < self.batch_size:
+                if self.requests.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        requests.append(await asyncio.wait_for(self.requests.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    requests.append(self.requests.get_nowait())
+
+            expressions = [expression for expression, _, _ in requests]
+            try:
+                results = await self.evaluate(expressions)
+            except asyncio.TimeoutError:
+                results = await asyncio.gather(*(self.evaluate_alone(expression) for expression in expressions))
+            except Exception as error:
+                for _, future, _ in requests:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            now = time.perf_counter()
+            for (_, future, received), result in zip(requests, results):
+                self.latency.record(now - received)
+                if not future.done():
+                    future.set_result(result)
+
+    async def evaluate(self, expressions: list) -> list:
+        """!
+            @brief Method for evaluating expressions in the executor
+            @param expressions List of expression strings
+            @return List of result strings
+            @exception asyncio.TimeoutError Evaluation took longer than the timeout, the executor still finishes it
+        """
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(loop.run_in_executor(self.executor, batch.evaluate_chunk, expressions),
+                                      self.timeout)
+
+    async def evaluate_alone(self, expression: str) -> str:
+        """!
+            @brief Method for evaluating an expression of a batch which timed out
+            @param expression Expression string
+            @return Result string, error message if the expression timed out again
+        """
+
+        try:
+            return (await self.evaluate([expression]))[0]
+        except asyncio.TimeoutError:
+            return "Couldn't parse expression"
+
+    def stats(self) -> dict:
+        """!
+            @brief Method for getting the statistics of the service
+            @return Dictionary with the number of requests and latency percentiles in seconds
+        """
+
+        return {"requests": self.latency.count, "latency": self.latency.percentiles()}
+
+    async def handle(self, reader, writer):
+        """!
+            @brief Method for serving a single connection, requests can be pipelined
+            @param reader asyncio.StreamReader of the connection
+            @param writer asyncio.StreamWriter of the connection
+        """
+
+        answers = asyncio.Queue()
+        responder = asyncio.create_task(self.respond(answers, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                expression = line.decode("utf-8").rstrip("\r\n")
+                if expression == STATS_REQUEST:
+                    answer = asyncio.get_running_loop().create_future()
+                    answer.set_result(json.dumps(self.stats()))
+                else:
+                    answer = self.submit(expression)
+                answers.put_nowait(answer)
+        finally:
+            answers.put_nowait(None)
+            await responder
+            writer.close()
+
+    @staticmethod
+    async def respond(answers, writer):
+        """!
+            @brief Task writing the answers of a connection in the order of the requests
+            @param answers asyncio.Queue of futures with result strings, None ends the task
+            @param writer asyncio.StreamWriter of the connection
+        """
+
+        while True:
+            answer = await answers.get()
+            if answer is None:
+                return
+            try:
+                result = await answer
+            except Exception:
+                result = "Couldn't parse expression"
+            writer.write(result.encode("utf-8") + b"\n")
+            if answers.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    return
+
+
+class CalculatorClient:
+    """!
+        @brief Class "CalculatorClient", asyncio client of CalculatorService, requests can be sent concurrently
+    """
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.pending = deque()
+        self.receiver = None
+
+    async def connect(self, host: str = "127.0.0.1", port: int = 0, path: str = None):
+        """!
+            @brief Method for connecting to a TCP port or a Unix socket
+            @param host Host name of the server
+            @param port TCP port of the server
+            @param path Path of the Unix socket, TCP is used if None
+            @return self
+        """
+
+        if path is None:
+            self.reader, self.writer = await asyncio.open_connection(host, port)
+        else:
+            self.reader, self.writer = await asyncio.open_unix_connection(path)
+        self.receiver = asyncio.create_task(self.receive())
+        return self
+
+    async def receive(self):
+        """! @brief Task resolving the pending requests by the answers of the server """
+
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                self.pending.popleft().set_result(line.decode("utf-8").rstrip("\n"))
+        finally:
+            while self.pending:
+                self.pending.popleft().set_exception(ConnectionError("Connection closed by the server"))
+
+    async def evaluate(self, expression: str) -> str:
+        """!
+            @brief Method for evaluating an expression by the server
+            @param expression Expression string without new lines
+            @return Result string of the expression or error message
+            @exception ConnectionError Connection was closed before the answer
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(future)
+        self.writer.write(expression.encode("utf-8") + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def stats(self) -> dict:
+        """!
+            @brief Method for getting the statistics of the server
+            @return Dictionary with the number of requests and latency percentiles in seconds
+        """
+
+        return json.loads(await self.evaluate(STATS_REQUEST))
+
+    async def close(self):
+        """! @brief Method for closing the connection """
+
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.receiver
@@ -10,6 +10,7 @@
 """
 
 import sys
+from array import array
 
 
 class Stack:
@@ -57,4 +58,93 @@ class Stack:
     def clear(self):
         """! @brief Clears the stack """
 
-        self.items = []
+        self.items.clear()
+
+
+
+class NumberStack:
+    """!
+        @brief Class NumberStack, stack of floats in a preallocated array('d') with an index of the top
+    """
+
+    __slots__ = ("items", "count")
+
+    """! Type code of the array """
+    typecode = 'd'
+
+    def __init__(self, capacity: int = 64):
+        """!
+            @param capacity Number of preallocated items, the array is doubled when it is full
+        """
+
+        self.items = array(self.typecode, [0]) * max(capacity, 1)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, value):
+        """! @brief Push given number on top of the stack """
+
+        count = self.count
+        if count == len(self.items):
+            self.items.extend(self.items)
+        self.items[count] = value
+        self.count = count + 1
+
+    def pop(self):
+        """! @brief Pop a number from the stack """
+
+        count = self.count - 1
+        if count < 0:
+            raise IndexError("Empty stack.")
+        self.count = count
+        return self.items[count]
+
+    def size(self) -> int:
+        """! @brief Returns size of a stack """
+
+        return self.count
+
+    def top(self):
+        """! @brief Returns number on top of the stack """
+
+        if self.count == 0:
+            raise IndexError("Empty stack.")
+        return self.items[self.count - 1]
+
+    def is_empty(self) -> bool:
+        """! @brief Checking if the stack is empty """
+
+        return self.count == 0
+
+    def clear(self):
+        """! @brief Clears the stack, the array is kept """
+
+        self.count = 0
+
+    def reserve(self, capacity: int):
+        """!
+            @brief Method for preparing the array for direct access by index, the stack is cleared
+            @param capacity Maximal number of items
+            @return The array, the caller keeps its own index of the top
+
+            @par
+            Evaluators with a known maximal depth use the array as a list with
+            a local top index, so there are no method calls per item.
+        """
+
+        if len(self.items) < capacity:
+            self.items.extend(array(self.typecode, [0]) * (capacity - len(self.items)))
+        self.count = 0
+        return self.items
+
+
+class OperatorStack(NumberStack):
+    """!
+        @brief Class OperatorStack, stack of small integer operator codes (0 to 255) in a preallocated array('B')
+    """
+
+    __slots__ = ()
+
+    typecode = 'B'
@@ -0,0 +1,209 @@
+"""!
+    @file stats.py
+
+    @brief Single-pass statistics (mean, variance, standard deviation) of streamed numbers
+
+    @date 17.10.2026
+
+    @par
+    RunningStats uses Welford's algorithm, so the numbers are read only once
+    and never stored. Accumulators of separate chunks can be merged, which is
+    used by parallel_stats() to split a file between processes.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+class RunningStats:
+    """!
+        @brief Class "RunningStats", streaming accumulator of count, mean and sum of squared deviations
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def __repr__(self):
+        return "RunningStats(count={}, mean={}, m2={})".format(self.count, self.mean, self.m2)
+
+    def push(self, x: float):
+        """!
+            @brief Method for adding a single number
+            @param x Number
+        """
+
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def update(self, numbers):
+        """!
+            @brief Method for adding all numbers of an iterable
+            @param numbers Iterable of numbers
+            @return self
+        """
+
+        count = self.count
+        mean = self.mean
+        m2 = self.m2
+        for x in numbers:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        return self
+
+    def merge(self, other: "RunningStats"):
+        """!
+            @brief Method for merging statistics of another chunk of numbers
+            @param other Statistics of the other chunk
+            @return self
+        """
+
+        count = self.count + other.count
+        if count == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    def variance(self) -> float:
+        """!
+            @brief Method for the sample variance
+            @return Variance of the numbers
+            @exception ZeroDivisionError Less than two numbers were added
+        """
+
+        if self.count < 2:
+            raise ZeroDivisionError("Variance needs at least two numbers")
+        return self.m2 / (self.count - 1)
+
+    def deviation(self) -> float:
+        """!
+            @brief Method for the sample standard deviation
+            @return Standard deviation of the numbers
+            @exception ZeroDivisionError Less than two numbers were added
+        """
+
+        return math.sqrt(self.variance())
+
+
+def read_numbers(stream, chunk_size: int = 1 << 16):
+    """!
+        @brief Generator of numbers from a text or binary stream with whitespace-separated numbers
+        @param stream File object, read in chunks of chunk_size
+        @param chunk_size Size of a single read
+        @return Generator of floats
+    """
+
+    rest = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if rest:
+            chunk = rest + chunk
+        tokens = chunk.split()
+        rest = None if chunk[-1:].isspace() or not tokens else tokens.pop()
+        for token in tokens:
+            yield float(token)
+
+    if rest:
+        yield float(rest)
+
+
+def from_stream(stream, chunk_size: int = 1 << 16) -> RunningStats:
+    """!
+        @brief Function for computing statistics of all numbers of a stream in a single pass
+        @param stream File object with whitespace-separated numbers
+        @param chunk_size Size of a single read
+        @return RunningStats of the numbers
+    """
+
+    return RunningStats().update(read_numbers(stream, chunk_size))
+
+
+class _FileRange:
+    """!
+        @brief Class "_FileRange", read-only view of a byte range of a file for read_numbers()
+    """
+
+    def __init__(self, file, start: int, end: int):
+        file.seek(start)
+        self.file = file
+        self.remaining = end - start
+
+    def read(self, size: int) -> bytes:
+        data = self.file.read(min(size, self.remaining))
+        self.remaining -= len(data)
+        return data
+
+
+def file_ranges(path: str, parts: int) -> list:
+    """!
+        @brief Function for splitting a file into byte ranges which don't split any number
+        @param path Path to the file with whitespace-separated numbers
+        @param parts Number of ranges
+        @return List of (start, end) tuples covering the whole file
+    """
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as file:
+        for part in range(1, parts):
+            position = max(size * part // parts, bounds[-1])
+            file.seek(position)
+            while position < size and not file.read(1).isspace():
+                position += 1
+            bounds.append(position)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def range_stats(path: str, start: int, end: int, chunk_size: int = 1 << 16) -> RunningStats:
+    """!
+        @brief Function for computing statistics of numbers in a byte range of a file
+        @param path Path to the file with whitespace-separated numbers
+        @param start First byte of the range
+        @param end Byte after the range
+        @param chunk_size Size of a single read
+        @return RunningStats of the numbers in the range
+    """
+
+    with open(path, "rb") as file:
+        return RunningStats().update(read_numbers(_FileRange(file, start, end), chunk_size))
+
+
+def parallel_stats(path: str, workers: int = None, chunk_size: int = 1 << 16) -> RunningStats:
+    """!
+        @brief Function for computing statistics of a file in parallel processes
+        @param path Path to the file with whitespace-separated numbers
+        @param workers Number of processes, os.cpu_count() by default
+        @param chunk_size Size of a single read
+        @return RunningStats of all numbers of the file
+    """
+
+    workers = workers or os.cpu_count() or 1
+    ranges = file_ranges(path, workers)
+    result = RunningStats()
+    if workers == 1:
+        for start, end in ranges:
+            result.merge(range_stats(path, start, end, chunk_size))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(range_stats, path, start, end, chunk_size) for start, end in ranges]
+        for future in futures:
+            result.merge(future.result())
+    return result
@@ -0,0 +1,165 @@
+"""!
+    @file tokenizer.py
+
+    @brief Single-pass tokenizer of math expressions
+
+    @date 17.10.2026
+
+    @par
+    The expression is scanned once, symbol by symbol (runs of digits, names and
+    whitespace are matched by compiled regular expressions), and it is
+    validated in the same pass: parentheses balance, operator adjacency and
+    number format are checked and the first error is raised together with its
+    offset. Functions are tokens of the grammar: sin, cos, tan and ctg take one
+    parenthesized argument, log(base)(x) and sqrt(degree)(x) take two and the
+    factorial ! is postfix. Unary minus at the beginning of the expression or after a left
+    parenthesis is merged into the following number or constant, so no tokens
+    have to be joined or deleted later.
+"""
+
+import re
+from collections import namedtuple
+
+from . import basic
+from . import exceptions as e
+
+NUMBER = "number"
+CONSTANT = "constant"
+NAME = "name"
+OPERATOR = "operator"
+PAREN = "paren"
+FUNCTION = "function"
+
+FACTORIAL = "!"
+
+"""! Function names and numbers of their parenthesized arguments """
+FUNCTIONS = {"sin": 1, "cos": 1, "tan": 1, "ctg": 1, "log": 2, "sqrt": 2}
+
+"""! Token of the expression, text of constants is their value, position is the offset in the expression """
+Token = namedtuple("Token", ["kind", "text", "position"])
+
+CONSTANTS = {"e": str(basic.Basic.exp), "π": str(basic.Basic.pi)}
+
+"""! Kinds of single-character tokens """
+SYMBOLS = {"+": OPERATOR, "-": OPERATOR, "×": OPERATOR, "÷": OPERATOR, "^": OPERATOR,
+           "(": PAREN, ")": PAREN, "π": CONSTANT, FACTORIAL: FUNCTION}
+
+NUMBER_PATTERN = re.compile(r"[0-9.]+")
+NAME_PATTERN = re.compile(r"[^\W\dπ][^\Wπ]*")
+SPACE_PATTERN = re.compile(r"\s+")
+
+
+def check_number(text: str, position: int):
+    """!
+        @brief Function for checking the number format
+        @param text Number string
+        @param position Offset of the number in the expression
+        @exception BadExpressionException Number is not correct
+    """
+
+    if text[0] == "." or text.count(".") > 1:
+        raise e.BadExpressionException("Wrong number format", position)
+    if len(text) >= 2 and text[0] == "0" and text[1] != ".":
+        raise e.BadExpressionException("Leading zero in number", position)
+
+
+def tokenize(expression: str, constants: dict = None):
+    """!
+        @brief Generator of checked tokens of an expression
+        @param expression Expression string
+        @param constants Dictionary of constant names and their values, CONSTANTS by default
+        @return Generator of Token tuples
+        @exception BadExpressionException The first error of the expression with its offset
+    """
+
+    if constants is None:
+        constants = CONSTANTS
+
+    """! Tokens are created by tuple.__new__, it is much faster than calling Token() for every token """
+    new = tuple.__new__
+    symbols = SYMBOLS
+    opened = []
+    groups = []
+    call = 0
+    expect_operand = True
+    previous = None
+    sign = None
+    length = len(expression)
+    index = 0
+    while index < length:
+        position = index
+        text = expression[index]
+        kind = symbols.get(text)
+
+        if kind is not None:
+            index += 1
+            if kind == CONSTANT:
+                text = constants[text]
+        elif "0" <= text <= "9" or text == ".":
+            index = NUMBER_PATTERN.match(expression, index).end()
+            text = expression[position:index]
+            kind = NUMBER
+            if text[0] == "." or index - position >= 2 and (text[0] == "0" and text[1] != "." or text.count(".") > 1):
+                check_number(text, position)
+        elif text.isspace():
+            index = SPACE_PATTERN.match(expression, index).end()
+            continue
+        else:
+            match = NAME_PATTERN.match(expression, index)
+            if match is None:
+                raise e.BadExpressionException("Unexpected character {!r}".format(text), position)
+            index = match.end()
+            text = match.group()
+            kind = NAME
+            if text in constants:
+                kind = CONSTANT
+                text = constants[text]
+            elif text in FUNCTIONS:
+                kind = FUNCTION
+
+        if call and text != "(":
+            raise e.BadExpressionException("Missing parenthesis", position)
+
+        if sign is not None:
+            if kind == NUMBER or kind == CONSTANT:
+                text = "-" + text
+                position = sign[2]
+            else:
+                yield sign
+                previous = "-"
+            sign = None
+
+        if expect_operand:
+            if kind == NUMBER or kind == CONSTANT or kind == NAME:
+                expect_operand = False
+            elif text == "(":
+                opened.append(position)
+                groups.append(call - 1 if call else 0)
+                call = 0
+            elif kind == FUNCTION and text != FACTORIAL:
+                call = FUNCTIONS[text]
+            elif text == "-" and (previous is None or previous == "("):
+                sign = new(Token, (kind, text, position))
+                continue
+            else:
+                raise e.BadExpressionException("Missing operand", position)
+        elif kind == OPERATOR:
+            expect_operand = True
+        elif text == ")":
+            if not opened:
+                raise e.BadExpressionException("Unbalanced parenthesis", position)
+            opened.pop()
+            call = groups.pop()
+            expect_operand = call > 0
+        elif text != FACTORIAL:
+            raise e.BadExpressionException("Missing operator", position)
+
+        previous = text
+        yield new(Token, (kind, text, position))
+
+    if call:
+        raise e.BadExpressionException("Missing parenthesis", length)
+    if sign is not None or (expect_operand and previous is not None):
+        raise e.BadExpressionException("Missing operand", length)
+    if opened:
+        raise e.BadExpressionException("Unbalanced parenthesis", opened[-1])
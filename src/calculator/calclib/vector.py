@@ -0,0 +1,307 @@
+"""!
+    @file vector.py
+
+    @brief Array versions of the basic and advanced mathematical operations
+
+    @date 17.10.2026
+
+    @par
+    Operations accept lists, array.array or NumPy arrays (a number is accepted
+    as the second operand too) and round the results by the int_translate rule
+    of the Basic class. With NumPy installed the results are numpy.ndarray of
+    float64, array('d') is returned instead. Trigonometric functions always
+    take radians and are computed by libm, they don't use angles.unit() or
+    the table of common angles of the Advanced methods.
+"""
+
+import math
+from array import array
+from itertools import repeat
+
+from . import advanced
+from . import exceptions as e
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _pairs(xs, ys):
+    """! @brief Pairs of operands for the pure Python implementation, ys can be a single number """
+
+    if isinstance(ys, (int, float)):
+        return zip(xs, repeat(ys))
+    if len(xs) != len(ys):
+        raise ValueError("Operands have different lengths")
+    return zip(xs, ys)
+
+
+def _operands(xs, ys):
+    """! @brief Operands converted to NumPy arrays """
+
+    xs = numpy.asarray(xs, dtype=numpy.float64)
+    ys = numpy.asarray(ys, dtype=numpy.float64)
+    if ys.ndim and xs.shape != ys.shape:
+        raise ValueError("Operands have different lengths")
+    return xs, ys
+
+
+def _round(num: float) -> float:
+    """! @brief Basic.int_translate for a single float """
+
+    return num if num.is_integer() else round(num, 7)
+
+
+def int_translate(values):
+    """!
+        @brief Vectorized Basic.int_translate, integers are kept and other numbers are rounded to 7 decimal places
+        @param values Array of numbers
+        @return Array of rounded numbers
+    """
+
+    if numpy is not None:
+        values = numpy.asarray(values, dtype=numpy.float64)
+        shape = values.shape
+        values = values.reshape(-1)
+        with numpy.errstate(all="ignore"):
+            scaled = values * 1e7
+            rounded = numpy.rint(scaled) / 1e7
+            """! Scaling is not exact, so numbers near a tie are rounded by round() like in Basic.int_translate """
+            ties = numpy.abs(scaled - numpy.floor(scaled) - 0.5) <= numpy.maximum(1e-6, numpy.abs(scaled) * 1e-15)
+            ties &= numpy.isfinite(values)
+            for index in numpy.flatnonzero(ties):
+                rounded[index] = round(float(values[index]), 7)
+            return numpy.where(values == numpy.floor(values), values, rounded).reshape(shape)
+
+    return array('d', [_round(float(num)) for num in values])
+
+
+def add(xs, ys):
+    """!
+        @brief Element-wise + operation
+        @param xs First operands
+        @param ys Second operands
+        @return Array of sums
+    """
+
+    if numpy is not None:
+        xs, ys = _operands(xs, ys)
+        return int_translate(xs + ys)
+
+    return array('d', [_round(float(x + y)) for x, y in _pairs(xs, ys)])
+
+
+def sub(minuends, subtrahends):
+    """!
+        @brief Element-wise - operation
+        @param minuends First operands
+        @param subtrahends Second operands
+        @return Array of differences
+    """
+
+    if numpy is not None:
+        minuends, subtrahends = _operands(minuends, subtrahends)
+        return int_translate(minuends - subtrahends)
+
+    return array('d', [_round(float(x - y)) for x, y in _pairs(minuends, subtrahends)])
+
+
+def mul(multipliers, multiplicants):
+    """!
+        @brief Element-wise * operation
+        @param multipliers First operands
+        @param multiplicants Second operands
+        @return Array of products
+    """
+
+    if numpy is not None:
+        multipliers, multiplicants = _operands(multipliers, multiplicants)
+        return int_translate(multipliers * multiplicants)
+
+    return array('d', [_round(float(x * y)) for x, y in _pairs(multipliers, multiplicants)])
+
+
+def div(dividents, divisors):
+    """!
+        @brief Element-wise / operation
+        @param dividents Numbers to be divided
+        @param divisors Numbers to divide by
+        @return Array of division results
+        @exception ZeroDivisionError Some of the divisors is zero
+    """
+
+    if numpy is not None:
+        dividents, divisors = _operands(dividents, divisors)
+        if (divisors == 0).any():
+            raise ZeroDivisionError
+        return int_translate(dividents / divisors)
+
+    pairs = list(_pairs(dividents, divisors))
+    for _, y in pairs:
+        if y == 0:
+            raise ZeroDivisionError
+    return array('d', [_round(float(x / y)) for x, y in pairs])
+
+
+def power(bases, exponents):
+    """!
+        @brief Element-wise exponentiation, the real part is taken for negative bases like in Advanced.power
+        @param bases Base numbers
+        @param exponents Exponent numbers
+        @return Array of powers
+    """
+
+    if numpy is not None:
+        bases, exponents = _operands(bases, exponents)
+        if ((bases == 0) & (exponents < 0)).any():
+            raise ZeroDivisionError
+        with numpy.errstate(all="ignore"):
+            result = numpy.power(numpy.abs(bases), exponents)
+            odd = numpy.where(exponents == numpy.floor(exponents), numpy.mod(exponents, 2) == 1, False)
+            result = numpy.where(bases < 0, numpy.where(odd, -result, result), result)
+            fractional = (bases < 0) & (exponents != numpy.floor(exponents))
+            result = numpy.where(fractional, result * numpy.cos(math.pi * exponents), result)
+        return int_translate(result)
+
+    return array('d', [_round(float(complex(pow(x, y)).real)) for x, y in _pairs(bases, exponents)])
+
+
+def rootn(degrees, radicands):
+    """!
+        @brief Element-wise n-th root, computed the same way as Advanced.rootn
+        @param degrees Root degrees, a single number can be given for all the radicands
+        @param radicands Numbers from which the roots have to be extracted
+        @return Array of roots
+    """
+
+    if isinstance(degrees, (int, float)):
+        return power(radicands, _round(float(1 / degrees)))
+
+    if numpy is not None:
+        degrees = numpy.asarray(degrees, dtype=numpy.float64)
+        if (degrees == 0).any():
+            raise ZeroDivisionError
+        return power(radicands, int_translate(1 / degrees))
+
+    return power(radicands, array('d', [_round(float(1 / degree)) for degree in degrees]))
+
+
+def logarithm(numbers, bases):
+    """!
+        @brief Element-wise logarithm
+        @param numbers Antilogarithm numbers
+        @param bases Base numbers
+        @return Array of logarithms
+        @exception BadOperandException Some of the bases or numbers are not correct
+    """
+
+    if numpy is not None:
+        numbers, bases = _operands(numbers, bases)
+        if (bases == 1).any() or (bases <= 0).any() or (numbers <= 0).any():
+            raise e.BadOperandException
+        return int_translate(numpy.log(numbers) / numpy.log(bases))
+
+    pairs = list(_pairs(numbers, bases))
+    for number, base in pairs:
+        if base == 1 or base <= 0 or number <= 0:
+            raise e.BadOperandException
+    return array('d', [_round(math.log(number, base)) for number, base in pairs])
+
+
+def sinus(xs):
+    """!
+        @brief Element-wise sinus function
+        @param xs Angles in radians, regardless of angles.unit()
+        @return Array of sines
+    """
+
+    if numpy is not None:
+        return int_translate(numpy.sin(numpy.asarray(xs, dtype=numpy.float64)))
+
+    return array('d', [_round(math.sin(x)) for x in xs])
+
+
+def cosines(xs):
+    """!
+        @brief Element-wise cosines function
+        @param xs Angles in radians, regardless of angles.unit()
+        @return Array of cosines
+    """
+
+    if numpy is not None:
+        return int_translate(numpy.cos(numpy.asarray(xs, dtype=numpy.float64)))
+
+    return array('d', [_round(math.cos(x)) for x in xs])
+
+
+def sincos(xs) -> tuple:
+    """!
+        @brief Element-wise sinus and cosines functions in a single pass
+        @param xs Angles in radians, regardless of angles.unit()
+        @return Tuple of the array of sines and the array of cosines
+    """
+
+    if numpy is not None:
+        xs = numpy.asarray(xs, dtype=numpy.float64)
+        return int_translate(numpy.sin(xs)), int_translate(numpy.cos(xs))
+
+    sines = array('d')
+    cosines = array('d')
+    for x in xs:
+        sines.append(_round(math.sin(x)))
+        cosines.append(_round(math.cos(x)))
+    return sines, cosines
+
+
+def tangent(xs):
+    """!
+        @brief Element-wise tangents function, every tangent is rounded only once
+        @param xs Angles in radians, regardless of angles.unit()
+        @return Array of tangents
+    """
+
+    if numpy is not None:
+        return int_translate(numpy.tan(numpy.asarray(xs, dtype=numpy.float64)))
+
+    return array('d', [_round(math.tan(x)) for x in xs])
+
+
+def cotangent(xs):
+    """!
+        @brief Element-wise cotangents function, every cotangent is rounded only once
+        @param xs Angles in radians, regardless of angles.unit()
+        @return Array of cotangents
+        @exception ZeroDivisionError Sine of some of the angles is zero
+    """
+
+    if numpy is not None:
+        xs = numpy.asarray(xs, dtype=numpy.float64)
+        sines = numpy.sin(xs)
+        if (sines == 0).any():
+            raise ZeroDivisionError
+        return int_translate(numpy.cos(xs) / sines)
+
+    results = array('d')
+    for x in xs:
+        sine = math.sin(x)
+        if sine == 0:
+            raise ZeroDivisionError
+        results.append(_round(math.cos(x) / sine))
+    return results
+
+
+def factorial(xs) -> list:
+    """!
+        @brief Element-wise factorial, results are exact so they are returned as a list of integers
+        @param xs Non-negative integers
+        @return List of factorials
+        @exception BadOperandException Some of the operands is negative, not an integer or above FACTORIAL_MAX
+    """
+
+    numbers = []
+    for x in xs:
+        if x < 0 or not float(x).is_integer() or x > advanced.FACTORIAL_MAX:
+            raise e.BadOperandException
+        numbers.append(int(x))
+    return [math.factorial(x) for x in numbers]
@@ -0,0 +1,45 @@
+"""!
+    @file evaluate.py
+
+    @brief Evaluation of files with one expression per line in parallel processes
+
+    @date 17.10.2026
+
+    @par
+    Usage: python evaluate.py INPUT [-o OUTPUT] [-w WORKERS] [-c CHUNK]
+    Results are written in the order of the input and the throughput is
+    reported to stderr.
+"""
+
+import argparse
+import sys
+
+from calculator.calclib import batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate a file with one expression per line")
+    parser.add_argument("input", help="input file, - for standard input")
+    parser.add_argument("-o", "--output", help="output file, standard output by default")
+    parser.add_argument("-w", "--workers", type=int, help="number of processes, number of CPUs by default")
+    parser.add_argument("-c", "--chunk-size", type=int, default=1000, help="number of lines sent to a worker at once")
+    args = parser.parse_args()
+    if args.chunk_size < 1 or (args.workers is not None and args.workers < 1):
+        parser.error("--workers and --chunk-size must be positive")
+
+    stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    try:
+        report = batch.run_batch(stream, output, args.workers, args.chunk_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if output is not sys.stdout:
+            output.close()
+
+    rate = report.count / report.seconds if report.seconds else 0.0
+    sys.stderr.write("{} expressions in {:.3f} s, {:.0f} expressions/s\n".format(report.count, report.seconds, rate))
+
+
+if __name__ == '__main__':
+    main()
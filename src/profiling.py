@@ -1,30 +1,52 @@
+import argparse
+import sys
+
+from calculator.calclib import reader, stats
 from calculator.calclib.advanced import Advanced
 
 math = Advanced()
 
 
-def calculate_deviation(nums: list):
+def calculate_deviation(nums):
     N = len(nums)
     sum = 0
     mean = calculate_mean(nums)
 
-    for i in range(0, N):
-        sum = math.add(sum, math.power(int(nums[i]), 2))
+    for num in nums:
+        sum = math.add(sum, math.power(num, 2))
 
     const = math.mul(N, math.power(mean, 2))
     res = math.rootn(2, math.div(math.sub(sum, const), math.sub(N, 1)))
     return res
 
 
-def calculate_mean(nums: list):
+def calculate_mean(nums):
     N = len(nums)
     x = 0
-    for i in range(0, N):
-        x = math.add(x, int(nums[i]))
+    for num in nums:
+        x = math.add(x, num)
 
     return math.mul(math.div(1, N), x)
 
 
 if __name__ == '__main__':
-    nums = input().split(" ")
-    print(calculate_deviation(nums))
+    parser = argparse.ArgumentParser(description="Standard deviation of whitespace-separated numbers")
+    parser.add_argument("file", nargs="?", help="input file, standard input is read if not given")
+    parser.add_argument("-w", "--workers", type=int, help="split the input file between this number of processes")
+    parser.add_argument("-m", "--mmap", action="store_true",
+                        help="memory-map the input file and compute the deviation with the calclib operations")
+    args = parser.parse_args()
+
+    if args.mmap:
+        if args.file is None:
+            parser.error("--mmap needs an input file")
+        print(calculate_deviation(reader.map_numbers(args.file)))
+    elif args.workers is not None:
+        if args.file is None or args.workers < 1:
+            parser.error("--workers needs an input file and a positive number of workers")
+        print(math.int_translate(stats.parallel_stats(args.file, args.workers).deviation()))
+    elif args.file is None:
+        print(math.int_translate(stats.from_stream(sys.stdin.buffer).deviation()))
+    else:
+        with open(args.file, "rb") as file:
+            print(math.int_translate(stats.from_stream(file).deviation()))
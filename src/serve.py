@@ -0,0 +1,55 @@
+"""!
+    @file serve.py
+
+    @brief Long-lived calculator service on a TCP port or a Unix socket
+
+    @date 17.10.2026
+
+    @par
+    Usage: python serve.py [--host HOST] [--port PORT | --unix PATH] [-w WORKERS] [--processes] [--timeout SECONDS]
+    Every line sent to the service is answered by the result of the expression.
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from calculator.calclib import cache, service
+
+
+async def serve(args):
+    executor_class = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    with executor_class(max_workers=args.workers) as executor:
+        calculator = service.CalculatorService(executor, args.batch_size, args.batch_delay / 1000, args.timeout)
+        server = await calculator.start(args.host, args.port, args.unix)
+        for sock in server.sockets:
+            print("Serving on {}".format(sock.getsockname()), flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await calculator.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the calculator over newline-delimited expressions")
+    parser.add_argument("--host", default="127.0.0.1", help="host name of the TCP server")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port")
+    parser.add_argument("--unix", help="path of a Unix socket, used instead of TCP")
+    parser.add_argument("-w", "--workers", type=int, help="number of evaluating threads or processes")
+    parser.add_argument("--processes", action="store_true", help="evaluate in processes instead of threads")
+    parser.add_argument("--batch-size", type=int, default=64, help="maximal number of expressions evaluated at once")
+    parser.add_argument("--batch-delay", type=float, default=0.5, help="time for collecting a batch in milliseconds")
+    parser.add_argument("--timeout", type=float, default=5.0, help="time for evaluating a batch in seconds")
+    parser.add_argument("--cache", type=int, default=0, help="size of the result cache, disabled if 0")
+    args = parser.parse_args()
+
+    if args.cache > 0:
+        cache.enable_cache(args.cache)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
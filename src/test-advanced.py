@@ -3,8 +3,10 @@
 Author: Alina Vinogradova
 """
 
+import math
 import unittest
 from unittest_prettify.colorize import *
+from calculator.calclib import advanced
 from calculator.calclib.advanced import Advanced
 from calculator.calclib.exceptions import BadOperandException
 
@@ -95,6 +97,21 @@ class FactorialTests(unittest.TestCase):
         num = -5
         self.assertEqual(None, self.op.factorial(num))
 
+    def test_cached(self):
+        """Numbers above the table are computed once and cached"""
+        self.assertEqual(math.factorial(150), self.op.factorial(150))
+        self.assertEqual(math.factorial(149), self.op.factorial(149))
+        self.assertEqual(math.factorial(151), self.op.factorial(151))
+
+    def test_huge(self):
+        """Numbers above the cache limit"""
+        num = advanced.FACTORIAL_CACHE_LIMIT + 1000
+        self.assertEqual(math.factorial(num), self.op.factorial(num))
+
+    def test_too_large(self):
+        """Numbers above the largest operand"""
+        self.assertEqual(None, self.op.factorial(advanced.FACTORIAL_MAX + 1))
+
 @colorize(color=YELLOW)
 class LogarithmTests(unittest.TestCase):
 
@@ -151,5 +168,26 @@ class RootTests(unittest.TestCase):
         self.assertEqual(0, self.op.rootn(degree, num))
 
 
+@colorize(color=GREEN)
+class TrigonometryTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.op = Advanced()
+
+    def test_tangent(self):
+        """Tangent is rounded once"""
+        self.assertEqual(round(math.tan(0.5), 7), self.op.tang(0.5))
+        self.assertEqual(0, self.op.tang(0))
+
+    def test_cotangent(self):
+        """Cotangent is rounded once"""
+        self.assertEqual(round(math.cos(0.5) / math.sin(0.5), 7), self.op.cotg(0.5))
+
+    def test_cotangent_zero(self):
+        """Cotangent of zero"""
+        with self.assertRaises(ZeroDivisionError):
+            self.op.cotg(0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+@brief file test-angles.py with unit tests of the angle unit and the table of common angles
+"""
+
+import math
+import unittest
+from calculator.calclib import angles, cache
+from calculator.calclib.advanced import Advanced
+from calculator.calclib.expressions import MathParsing
+
+
+class TableTests(unittest.TestCase):
+    print('Testing table of common angles')
+
+    def setUp(self) -> None:
+        self.op = Advanced()
+
+    def tearDown(self) -> None:
+        angles.set_unit(angles.RADIANS)
+
+    def test_table(self):
+        """Test the table agrees with libm for all multiples of 15 degrees"""
+        for step in range(24):
+            x = math.radians(step * 15)
+            self.assertEqual(round(math.sin(x), 7), angles.TABLE["sin"][step])
+            self.assertEqual(round(math.cos(x), 7), angles.TABLE["cos"][step])
+
+    def test_degrees(self):
+        """Test exact values of angles in degrees"""
+        angles.set_unit(angles.DEGREES)
+        self.assertEqual(0.5, self.op.sinus(30))
+        self.assertEqual(0, self.op.cosines(90))
+        self.assertEqual(1, self.op.tang(225))
+        self.assertEqual(-1, self.op.cotg(-45))
+        self.assertEqual(0.5, self.op.sinus(750))
+        self.assertEqual(-0.5, self.op.sinus(-150))
+
+    def test_degrees_other(self):
+        """Test angles in degrees which are not in the table"""
+        angles.set_unit(angles.DEGREES)
+        self.assertEqual(round(math.sin(math.radians(29)), 7), self.op.sinus(29))
+
+    def test_undefined(self):
+        """Test tangent of 90 degrees and cotangent of 180 degrees"""
+        angles.set_unit(angles.DEGREES)
+        with self.assertRaises(ZeroDivisionError):
+            self.op.tang(90)
+        with self.assertRaises(ZeroDivisionError):
+            self.op.cotg(180)
+
+    def test_radians(self):
+        """Test multiples of pi/12 in radians"""
+        self.assertEqual(0.5, self.op.sinus(math.pi / 6))
+        self.assertEqual(0, self.op.cosines(math.pi / 2))
+        with self.assertRaises(ZeroDivisionError):
+            self.op.tang(math.pi / 2)
+        self.assertEqual(0.4794255, self.op.sinus(0.5))
+
+    def test_calculator_pi(self):
+        """Test multiples of the rounded π of the calculator in radians"""
+        self.assertEqual(2, angles.step(0.5236))
+        self.assertEqual(0.5, self.op.sinus(self.op.pi / 6))
+        self.assertEqual(-1, self.op.cosines(self.op.pi))
+        with self.assertRaises(ZeroDivisionError):
+            self.op.tang(self.op.pi / 2)
+        self.assertIsNone(angles.step(0.5235))
+
+    def test_large_angles(self):
+        """Test large angles are not looked up in the table"""
+        for x in (1e16, 1e18, 1e20, 12345.0):
+            self.assertIsNone(angles.step(x))
+            self.assertEqual(round(math.sin(x), 7), self.op.sinus(x))
+        self.assertEqual(round(math.tan(1e18), 7), self.op.tang(1e18))
+        angles.set_unit(angles.DEGREES)
+        self.assertIsNone(angles.step(1e18))
+        self.assertEqual(0.5, self.op.sinus(3630))
+
+    def test_unknown_unit(self):
+        """Test unknown angle unit"""
+        with self.assertRaises(ValueError):
+            angles.set_unit("grads")
+
+
+class ParseTrigonometryTests(unittest.TestCase):
+    print('Testing trigonometry of the parser')
+
+    def setUp(self) -> None:
+        self.parser = MathParsing()
+
+    def tearDown(self) -> None:
+        angles.set_unit(angles.RADIANS)
+        cache.disable_cache()
+
+    def test_number(self):
+        """Test the same results as parsing the whole call"""
+        for func in ("sin", "cos", "tan", "ctg"):
+            for expression in ("0.5", "-2", "1+2", "π÷6", "3!"):
+                self.assertEqual(self.parser.parse("{}({})".format(func, expression)),
+                                 self.parser.parse_trigonometry(func, expression))
+
+    def test_errors(self):
+        """Test wrong arguments"""
+        for expression in ("", "(", "1+", "x", "ctg(0)"):
+            self.assertEqual("Couldn't parse expression", self.parser.parse_trigonometry("sin", expression))
+        self.assertEqual("Couldn't parse expression", self.parser.parse_trigonometry("ctg", "0"))
+
+    def test_degrees(self):
+        """Test the unit is used by parsed expressions"""
+        angles.set_unit(angles.DEGREES)
+        self.assertEqual("0.5", self.parser.parse_trigonometry("sin", "30"))
+        self.assertEqual("1.5", self.parser.parse("1+sin(30)"))
+        self.assertEqual("Couldn't parse expression", self.parser.parse("tan(45+45)"))
+
+    def test_pi_token(self):
+        """Test the π token gives exact values in radians"""
+        self.assertEqual("0.5", self.parser.parse("sin(π÷6)"))
+        self.assertEqual("Couldn't parse expression", self.parser.parse("tan(π÷2)"))
+        self.assertEqual("0.5", self.parser.parse_trigonometry("cos", "π÷3"))
+
+    def test_large_number(self):
+        """Test a large angle is computed by libm"""
+        self.assertEqual(str(round(math.sin(1e17), 7)), self.parser.parse("sin(100000000000000000)"))
+
+    def test_unit_clears_cache(self):
+        """Test cached results of the other unit are dropped"""
+        cache.enable_cache()
+        self.assertEqual("-0.9880316", self.parser.parse("sin(30)"))
+        angles.set_unit(angles.DEGREES)
+        self.assertEqual("0.5", self.parser.parse("sin(30)"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+@brief file test-batch.py with unit tests of the batch runner
+"""
+
+import io
+import unittest
+from calculator.calclib import batch
+
+
+class BatchTests(unittest.TestCase):
+    print('Testing batch evaluation')
+
+    def setUp(self) -> None:
+        self.lines = ['{}+{}×2'.format(i, i) for i in range(250)] + ['1÷0', '', '2000!', '(2+3)×4']
+        self.expected = [str(i * 3) for i in range(250)] + ["Couldn't parse expression", 'Enter math expression',
+                                                            "Couldn't parse expression", '20']
+
+    def run_batch(self, workers, chunk_size):
+        output = io.StringIO()
+        report = batch.run_batch(io.StringIO('\n'.join(self.lines) + '\n'), output, workers, chunk_size)
+        return report, output.getvalue().splitlines()
+
+    def test_single_process(self):
+        """Test evaluation in this process"""
+        report, results = self.run_batch(1, 16)
+        self.assertEqual(self.expected, results)
+        self.assertEqual(len(self.lines), report.count)
+
+    def test_processes(self):
+        """Test results of worker processes are in the input order"""
+        report, results = self.run_batch(3, 7)
+        self.assertEqual(self.expected, results)
+        self.assertEqual(len(self.lines), report.count)
+
+    def test_failing_line(self):
+        """Test an exception of the parser fails only its line"""
+        class FailingParser:
+            def parse(self, expression):
+                if expression == 'fail':
+                    raise RuntimeError(expression)
+                return expression
+
+        parser = FailingParser()
+        self.assertEqual(['1', "Couldn't parse expression", '2'],
+                         [batch.evaluate_line(parser, expression) for expression in ['1', 'fail', '2']])
+
+    def test_chunks(self):
+        """Test chunks of lines without line endings"""
+        chunks = list(batch.read_chunks(io.StringIO('1\r\n2\n3'), 2))
+        self.assertEqual([['1', '2'], ['3']], chunks)
+
+    def test_empty(self):
+        """Test empty input"""
+        output = io.StringIO()
+        self.assertEqual(0, batch.run_batch(io.StringIO(''), output, 2).count)
+        self.assertEqual('', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
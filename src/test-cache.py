@@ -0,0 +1,68 @@
+"""
+@brief file test-cache.py with unit tests of the result cache
+"""
+
+import unittest
+from calculator.calclib import cache
+from calculator.calclib.expressions import MathParsing
+
+
+class LRUCacheTests(unittest.TestCase):
+    print('Testing LRU cache')
+
+    def test_hits_and_misses(self):
+        """Test counters of found and missing items"""
+        results = cache.LRUCache(4)
+        self.assertIsNone(results.get('1+1'))
+        results.put('1+1', '2')
+        self.assertEqual('2', results.get('1+1'))
+        self.assertEqual(cache.CacheInfo(1, 1, 0, 1, 4), results.info())
+
+    def test_eviction(self):
+        """Test the least recently used item is evicted"""
+        results = cache.LRUCache(2)
+        results.put('a', 1)
+        results.put('b', 2)
+        results.get('a')
+        results.put('c', 3)
+        self.assertIsNone(results.get('b'))
+        self.assertEqual(1, results.get('a'))
+        self.assertEqual(1, results.info().evictions)
+        self.assertEqual(2, len(results))
+
+    def test_size(self):
+        """Test cache size must be positive"""
+        with self.assertRaises(ValueError):
+            cache.LRUCache(0)
+
+
+class ParseCacheTests(unittest.TestCase):
+    print('Testing cached parsing')
+
+    def setUp(self) -> None:
+        cache.enable_cache(8)
+
+    def tearDown(self) -> None:
+        cache.disable_cache()
+
+    def test_shared(self):
+        """Test the cache is shared by parser instances"""
+        self.assertEqual('11', MathParsing().parse('5+3×(4-2)'))
+        self.assertEqual('11', MathParsing().parse(' 5+3×(4-2) '))
+        self.assertEqual((1, 1), cache.cache_info()[:2])
+
+    def test_errors(self):
+        """Test error messages are cached too"""
+        for _ in range(2):
+            self.assertEqual("Couldn't parse expression", MathParsing().parse('5÷0'))
+        self.assertEqual(1, cache.cache_info().hits)
+
+    def test_disabled(self):
+        """Test parsing without cache"""
+        cache.disable_cache()
+        self.assertEqual('4', MathParsing().parse('2+2'))
+        self.assertIsNone(cache.cache_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
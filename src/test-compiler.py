@@ -0,0 +1,332 @@
+"""
+@brief file test-compiler.py with unit tests of compiled expressions
+"""
+
+import unittest
+from array import array
+from calculator.calclib import angles, bytecode, numpy_backend, optimizer
+from calculator.calclib.expressions import MathParsing
+from calculator.calclib.exceptions import BadExpressionException, EvaluationException
+
+
+class CompileTests(unittest.TestCase):
+    print('Testing compilation')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_same_as_parse(self):
+        """Test compiled results are the same as parse results"""
+        for expr in ['5+5', '-1-(4-3)', '((-10)×(-5))+13', '93×e-100', '(100-(20÷4))÷5', '((100×5)-(-100))+5×π']:
+            self.assertEqual(self.op.parse(expr), str(self.op.compile(expr).evaluate()))
+
+    def test_precedence(self):
+        """Test operator precedence"""
+        self.assertEqual(-1, self.op.compile('1-2×3+4').evaluate())
+
+    def test_unary_minus(self):
+        """Test unary minus before parentheses"""
+        self.assertEqual(-14, self.op.compile('-(3+4)×2').evaluate())
+
+    def test_reusable(self):
+        """Test compiled expression can be evaluated repeatedly"""
+        compiled = self.op.compile('10.4÷2')
+        self.assertEqual(5.2, compiled.evaluate())
+        self.assertEqual(5.2, compiled.evaluate())
+
+    def test_parser_is_reusable(self):
+        """Test parser state is not affected by compilation"""
+        self.op.compile('5+5')
+        self.assertEqual('16', self.op.parse('5+5+(3+1+(1+1))'))
+
+    def test_immutable(self):
+        """Test compiled expression can't be changed"""
+        compiled = self.op.compile('5+5')
+        with self.assertRaises(AttributeError):
+            compiled.tree = None
+
+    def test_bad_expression(self):
+        """Test incorrect expressions"""
+        for expr in ['', '5+', '(5', '5)', '2π', '×5']:
+            with self.assertRaises(BadExpressionException):
+                self.op.compile(expr)
+
+    def test_division_by_zero(self):
+        """Test division by zero"""
+        with self.assertRaises(EvaluationException):
+            self.op.compile('5÷(2-2)').evaluate()
+
+    def test_float_exponent(self):
+        """Test non-integer exponent"""
+        with self.assertRaises(EvaluationException):
+            self.op.compile('2^0.5').evaluate()
+
+    def test_trigonometry_domain(self):
+        """Test trigonometry of an infinite angle"""
+        self.assertEqual("Couldn't parse expression", self.op.parse('sin(10^300×10^300)'))
+        for func in ['sin', 'cos', 'tan', 'ctg']:
+            with self.assertRaises(EvaluationException):
+                self.op.compile(func + '(x)').evaluate({'x': float('inf')})
+
+
+class VariableTests(unittest.TestCase):
+    print('Testing variables')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_basic_variable(self):
+        """Test expression with variables"""
+        compiled = self.op.compile('rate×(x+1)')
+        self.assertEqual(('rate', 'x'), compiled.variables)
+        self.assertEqual(9, compiled.evaluate({'x': 2, 'rate': 3}))
+
+    def test_negative_variable(self):
+        """Test negative variable in parentheses"""
+        self.assertEqual(-5, self.op.compile('(-x)').evaluate({'x': 5}))
+
+    def test_exponent_constant(self):
+        """Test constant e is not a variable"""
+        compiled = self.op.compile('e×x2')
+        self.assertEqual(('x2',), compiled.variables)
+        self.assertEqual(5.4366, compiled.evaluate({'x2': 2}))
+
+    def test_unbound_variable(self):
+        """Test missing variable value"""
+        with self.assertRaises(EvaluationException):
+            self.op.compile('x+y').evaluate({'x': 1})
+
+    def test_parse_variable(self):
+        """Test parse doesn't accept variables"""
+        self.assertEqual("Couldn't parse expression", self.op.parse('x+1'))
+
+    def test_evaluate_many_columns(self):
+        """Test evaluation for columns of values"""
+        compiled = self.op.compile('x÷y')
+        self.assertEqual([2, None, 0.5], compiled.evaluate_many({'x': [4, 1, 1], 'y': [2, 0, 2]}))
+
+    def test_evaluate_many_rows(self):
+        """Test evaluation for rows of values"""
+        compiled = self.op.compile('x^2')
+        self.assertEqual([1, 4, 9], compiled.evaluate_many([{'x': 1}, {'x': 2}, {'x': 3}]))
+
+    def test_evaluate_many_lengths(self):
+        """Test columns of different lengths"""
+        with self.assertRaises(ValueError):
+            self.op.compile('x+y').evaluate_many({'x': [1, 2], 'y': [1]})
+
+    def test_evaluate_many_domain(self):
+        """Test a math domain error fails only its row"""
+        compiled = self.op.compile('sin(x)')
+        self.assertEqual([0.841471, None], compiled.evaluate_many({'x': [1.0, float('inf')]}))
+
+
+@unittest.skipUnless(numpy_backend.available(), 'NumPy is not installed')
+class BytecodeTests(unittest.TestCase):
+    print('Testing bytecode')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_same_as_compiled(self):
+        """Test bytecode results are the same as results of compiled expressions"""
+        for expr in ['5+5', '-1-(4-3)', '((-10)×(-5))+13', '93×e-100', '(100-(20÷4))÷5', '((100×5)-(-100))+5×π',
+                     '1-2×3+4', '-(3+4)×2', '2^3^2', '10.4÷3', '(1.5-2)^3']:
+            self.assertEqual(self.op.compile(expr).evaluate(), bytecode.run(bytecode.compile_expression(expr)))
+
+    def test_program(self):
+        """Test opcodes, constants and stack depth"""
+        program = bytecode.compile_expression('2×(x+3)-x')
+        self.assertEqual(array('B', [bytecode.PUSH, bytecode.LOAD, bytecode.PUSH, bytecode.ADD, bytecode.MUL,
+                                     bytecode.LOAD, bytecode.SUB]), program.code)
+        self.assertEqual(array('d', [2, 3]), program.constants)
+        self.assertEqual(('x',), program.variables)
+        self.assertEqual(3, program.stack_size)
+
+    def test_variables(self):
+        """Test values of variables"""
+        program = bytecode.compile_expression('a×b-a')
+        self.assertEqual(10, bytecode.evaluate(program, {'a': 2, 'b': 6}))
+        with self.assertRaises(EvaluationException):
+            bytecode.evaluate(program, {'a': 2})
+
+    def test_functions(self):
+        """Test function opcodes"""
+        program = bytecode.compile_expression('log(2)(x)+sin(x)!')
+        self.assertEqual(array('B', [bytecode.PUSH, bytecode.LOAD, bytecode.LOG, bytecode.LOAD, bytecode.SIN,
+                                     bytecode.FACTORIAL, bytecode.ADD]), program.code)
+        for expr in ['sqrt(3)(x)-(x+1)!', 'ctg(x)^2', 'log(x)(8)×cos(x)', '-tan(-x)']:
+            self.assertEqual(self.op.compile(expr).evaluate({'x': 2}),
+                             bytecode.evaluate(bytecode.compile_expression(expr), {'x': 2}))
+
+    def test_errors(self):
+        """Test evaluation errors"""
+        for expr in ['1÷0', '2^0.5', '0^(-1)', 'log(1)(2)', '(-1)!']:
+            with self.assertRaises(EvaluationException):
+                bytecode.run(bytecode.compile_expression(expr))
+
+
+class OptimizerTests(unittest.TestCase):
+    print('Testing optimization')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def dump(self, expr):
+        return optimizer.dump(self.op.compile(expr, optimize=True).tree)
+
+    def test_folding(self):
+        """Test constant subexpressions are evaluated"""
+        self.assertEqual('6.2832', self.dump('π×2'))
+        self.assertEqual('7.3891549', self.dump('e^2'))
+        self.assertEqual('7×x', self.dump('(3+4)×x'))
+        self.assertEqual('(-7)', self.dump('-(3+4)'))
+
+    def test_identities(self):
+        """Test identities are removed"""
+        self.assertEqual('x', self.dump('x×1'))
+        self.assertEqual('x+y', self.dump('((x+y)+0)×1'))
+        self.assertEqual('x×y', self.dump('(x×y)^(2-1)'))
+
+    def test_rounding(self):
+        """Test identities are kept where rounding of the operation is observable"""
+        self.assertEqual('(x×1)×3', self.dump('x×1×3'))
+        compiled = self.op.compile('x×1×3', optimize=True)
+        self.assertEqual(self.op.compile('x×1×3').evaluate({'x': 0.123456789}), compiled.evaluate({'x': 0.123456789}))
+
+    def test_functions(self):
+        """Test folding and dump of functions"""
+        self.assertEqual('x+6', self.dump('x+3!'))
+        self.assertEqual('sin(x)+3', self.dump('sin(x)+log(2)(8)'))
+        self.assertEqual('log(x)((x+1))!', self.dump('log(x)(x+1)!'))
+
+    def test_angle_unit(self):
+        """Test trigonometric functions are evaluated with the unit set at evaluation"""
+        self.assertEqual('sin(30)+x', self.dump('sin(30)+x'))
+        compiled = self.op.compile('sin(30)+x', optimize=True)
+        try:
+            angles.set_unit(angles.DEGREES)
+            self.assertEqual(0.5, compiled.evaluate({'x': 0}))
+            self.assertEqual(0.5, self.op.compile('sin(30)+x', optimize=True).evaluate({'x': 0}))
+        finally:
+            angles.set_unit(angles.RADIANS)
+
+    def test_errors(self):
+        """Test failing operations are not folded"""
+        self.assertEqual('1÷0', self.dump('1÷0'))
+        with self.assertRaises(EvaluationException):
+            self.op.compile('x+1÷0', optimize=True).evaluate({'x': 1})
+
+    def test_exact_integers(self):
+        """Test large integers are not folded into floats"""
+        self.assertEqual('25!+x', self.dump('25!+x'))
+        for expr in ['25!+x', '3^40×x', '200!×x']:
+            self.assertEqual(self.op.compile(expr).evaluate({'x': 3}),
+                             self.op.compile(expr, optimize=True).evaluate({'x': 3}))
+
+    def test_same_results(self):
+        """Test optimized expressions give the same results"""
+        for expr in ['5+5', '-1-(4-3)', '((-10)×(-5))+13', '93×e-100', '(100-(20÷4))÷5', '((100×5)-(-100))+5×π',
+                     '10.4÷3×1', '(1.5-2)^3', '0+2^3^2']:
+            self.assertEqual(self.op.compile(expr).evaluate(), self.op.compile(expr, optimize=True).evaluate())
+
+    def test_dump_compiles(self):
+        """Test dump can be compiled again"""
+        expr = '(2×π-x)×(-y)+(-3)×x^2'
+        compiled = self.op.compile(expr, optimize=True)
+        again = self.op.compile(optimizer.dump(compiled.tree))
+        values = {'x': 1.25, 'y': -3}
+        self.assertEqual(compiled.evaluate(values), again.evaluate(values))
+
+    def test_dump_small_numbers(self):
+        """Test folded numbers are written without exponents, so dump can be compiled again"""
+        self.assertEqual('0.0000001×x', self.dump('1÷10000000×x'))
+        for expr in ['1÷10000000×x', '(0-1)÷10000000+x', '1÷1024÷1024×x']:
+            compiled = self.op.compile(expr, optimize=True)
+            again = self.op.compile(optimizer.dump(compiled.tree))
+            self.assertEqual(compiled.evaluate({'x': 3}), again.evaluate({'x': 3}))
+
+
+class SharedSubexpressionTests(unittest.TestCase):
+    print('Testing shared subexpressions')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_deduplicated(self):
+        """Test repeated subexpressions are evaluated once"""
+        compiled = self.op.compile('(x+1)×(x+1)-(x+1)')
+        self.assertEqual(1, compiled.shared)
+        self.assertEqual(6, compiled.deduplicated)
+        self.assertEqual(8, len(compiled.program))
+        self.assertEqual(6, compiled.evaluate({'x': 2}))
+
+    def test_nested(self):
+        """Test subexpressions inside repeated subexpressions are not stored"""
+        compiled = self.op.compile('((a×b)+c)÷((a×b)+c)+a×b')
+        self.assertEqual(2, compiled.shared)
+        self.assertEqual(8, compiled.deduplicated)
+        self.assertEqual(7, compiled.evaluate({'a': 2, 'b': 3, 'c': 1}))
+
+    def test_leaves(self):
+        """Test numbers and variables are not shared"""
+        compiled = self.op.compile('x+x+2×2')
+        self.assertEqual(0, compiled.shared)
+        self.assertEqual(0, compiled.deduplicated)
+
+    def test_same_results(self):
+        """Test results of shared subexpressions in all evaluators"""
+        expr = '+'.join('((x-{})×(y+1)-(x-{})^2)'.format(i % 3, i % 3) for i in range(12))
+        compiled = self.op.compile(expr)
+        values = {'x': 1.5, 'y': -2.25}
+        expected = sum(round(round((1.5 - i % 3) * -1.25, 7) - round((1.5 - i % 3) ** 2, 7), 7) for i in range(12))
+        self.assertAlmostEqual(expected, compiled.evaluate(values))
+        self.assertEqual(compiled.evaluate(values), bytecode.evaluate(bytecode.assemble(compiled), values))
+        self.assertEqual(9 * 13 + 3 * 3 + 2 * 3, compiled.deduplicated)
+
+    def test_error(self):
+        """Test failing shared subexpression"""
+        with self.assertRaises(EvaluationException):
+            self.op.compile('(1÷x)+(1÷x)').evaluate({'x': 0})
+
+
+class NumpyBackendTests(unittest.TestCase):
+    print('Testing NumPy backend')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_same_as_scalar(self):
+        """Test results are the same as scalar results"""
+        compiled = self.op.compile('x×2+y÷3-x^2')
+        columns = {'x': [1, 2.5, -3, 0.1], 'y': [1, 2, 3, 4.7]}
+        result, errors = numpy_backend.evaluate_columns(compiled, columns)
+        self.assertEqual(compiled.evaluate_many(columns), result.tolist())
+        self.assertFalse(errors.any())
+
+    def test_ties_same_as_scalar(self):
+        """Test chained operations on numbers whose halves are ties are rounded like scalar results"""
+        compiled = self.op.compile('((x÷2)÷(y×(x+y)))÷((0.5×(x+y))×(3-2))+x×0.5-y×0.25')
+        xs = [-1.108696065378437] + [(i * 37 % 2001 - 1000) / 1e4 + 1e-7 for i in range(2000)]
+        ys = [1] + [(i * 53 % 1999 - 999) / 1e3 + 3e-7 for i in range(2000)]
+        columns = {'x': xs, 'y': ys}
+        result, errors = numpy_backend.evaluate_columns(compiled, columns)
+        expected = compiled.evaluate_many(columns)
+        self.assertEqual([value is None for value in expected], errors.tolist())
+        self.assertEqual([value for value in expected if value is not None], result[~errors].tolist())
+
+    def test_error_mask(self):
+        """Test rows with division by zero and non-integer exponent"""
+        compiled = self.op.compile('x÷y+2^x')
+        result, errors = numpy_backend.evaluate_columns(compiled, {'x': [1, 1, 0.5], 'y': [2, 0, 1]})
+        self.assertEqual([False, True, True], errors.tolist())
+        self.assertEqual(2.5, result[0])
+
+    def test_constant_expression(self):
+        """Test expression without variables"""
+        result, errors = numpy_backend.evaluate_columns(self.op.compile('π×2'), {}, size=2)
+        self.assertEqual([6.2832, 6.2832], result.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,13 @@
 Author: Anastasiia Berezovska
 """
 
+import math
+import sys
+import threading
 import unittest
+from calculator.calclib import expressions
 from calculator.calclib.expressions import MathParsing
+from calculator.calclib.exceptions import EvaluationException
 
 
 class AdditionTests(unittest.TestCase):
@@ -280,6 +285,121 @@ class AllOperationsTests(unittest.TestCase):
         self.assertEqual('-13', self.op.parse(expr))
 
 
+class FunctionTests(unittest.TestCase):
+    print('Testing functions')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_functions(self):
+        """Test functions inside expressions"""
+        self.assertEqual('19', self.op.parse('sin(π÷2)+log(2)(8)×3!'))
+        self.assertEqual('6', self.op.parse('1+cos(0)+sqrt(2)(16)+tan(0)'))
+
+    def test_nested_arguments(self):
+        """Test arguments with parentheses and nested functions"""
+        self.assertEqual('2', self.op.parse('log(2)((1+1)×2)'))
+        self.assertEqual('5', self.op.parse('3+log(2)(sqrt(2)(16))'))
+        self.assertEqual('-8', self.op.parse('sqrt(1)(-8)'))
+
+    def test_factorial(self):
+        """Test factorial binds stronger than other operators"""
+        self.assertEqual('64', self.op.parse('2^3!'))
+        self.assertEqual('6', self.op.parse('(1+2)!'))
+        self.assertEqual("Couldn't parse expression", self.op.parse('2.5!'))
+        self.assertEqual(str(math.factorial(200)), self.op.parse('200!'))
+        self.assertEqual("Couldn't parse expression", self.op.parse('200!+1'))
+
+    def test_large_factorial(self):
+        """Test factorials too long to be written and too large operands"""
+        for expr in ['2000!', '(10!)!', '20!!', '(10^7)!']:
+            self.assertEqual("Couldn't parse expression", self.op.parse(expr))
+        self.assertEqual("Couldn't parse expression", self.op.parse_factorial('2000'))
+        with self.assertRaises(EvaluationException):
+            self.op.compile('x!').evaluate({'x': 10 ** 7})
+
+    def test_wrong_operands(self):
+        """Test functions with wrong operands"""
+        for expr in ['log(2)(0)', 'log(1)(5)', 'sqrt(2)(-4)', 'sqrt(0.5)(4)', 'log(2)', 'sin 1']:
+            self.assertEqual("Couldn't parse expression", self.op.parse(expr))
+
+    def test_deep_nesting(self):
+        """Test deeply nested functions are parsed without recursion"""
+        expr = 'sqrt(1)(' * 10000 + '2' + ')' * 10000
+        self.assertEqual('2', self.op.parse(expr))
+        self.assertEqual(2, self.op.compile(expr).evaluate())
+
+    def test_precedence(self):
+        """Test operators are applied by precedence"""
+        self.assertEqual('-1', self.op.parse('1-2×3+4'))
+        self.assertEqual('-14', self.op.parse('-(3+4)×2'))
+
+    def test_button_actions(self):
+        """Test factorial and trigonometry of the whole expression"""
+        self.assertEqual('6', self.op.parse_factorial('2+1'))
+        self.assertEqual('1', self.op.parse_trigonometry('cos', '2-2'))
+
+
+class ReuseTests(unittest.TestCase):
+    print('Testing reused parsers')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_reset_after_error(self):
+        """Test the parser is clean after an error"""
+        self.assertEqual("Couldn't parse expression", self.op.parse('5÷0+1'))
+        self.assertEqual([], self.op.tokens)
+        self.assertTrue(self.op.operand_stack.is_empty())
+        self.assertTrue(self.op.code_stack.is_empty())
+        self.assertEqual('3', self.op.parse('1+2'))
+
+    def test_reset_after_variable(self):
+        """Test the parser is clean after rejected variable"""
+        self.assertEqual("Couldn't parse expression", self.op.parse('x+1'))
+        self.assertEqual([], self.op.tokens)
+        self.assertEqual('7', self.op.parse('3+4'))
+
+    def test_shared_libraries(self):
+        """Test math libraries are shared by parsers"""
+        self.assertIs(self.op.adv, MathParsing().adv)
+
+    def test_shared_parser(self):
+        """Test every thread has its own parser"""
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(expressions.shared_parser()))
+        thread.start()
+        thread.join()
+        self.assertIs(expressions.shared_parser(), expressions.shared_parser())
+        self.assertIsNot(expressions.shared_parser(), parsers[0])
+
+
+class ConcurrencyTests(unittest.TestCase):
+    print('Testing concurrent evaluation')
+
+    def setUp(self) -> None:
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_evaluate(self):
+        """Test thread-safe entry point"""
+        self.assertEqual('14', expressions.evaluate('2×(3+4)'))
+
+    def test_order(self):
+        """Test results are in the order of the expressions"""
+        self.assertEqual(['2', "Couldn't parse expression", '9'],
+                         expressions.evaluate_concurrently(['1+1', '1÷0', '3^2'], max_workers=3))
+
+    def test_stress(self):
+        """Test 32 threads evaluating different expressions give the results of a single thread"""
+        exprs = ['{}×({}+{})-{}÷4'.format(i, i % 7, i % 13, i) for i in range(2000)]
+        exprs += ['(1+{})÷0'.format(i) for i in range(200)]
+        expected = [MathParsing().parse(expr) for expr in exprs]
+        for _ in range(3):
+            self.assertEqual(expected, expressions.evaluate_concurrently(exprs, max_workers=32))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,167 @@
+"""
+@brief file test-numeric.py with unit tests of the numeric backends
+"""
+
+import decimal
+import unittest
+from fractions import Fraction
+from calculator.calclib import cache, numeric
+from calculator.calclib.advanced import Advanced
+from calculator.calclib.basic import Basic
+from calculator.calclib.expressions import MathParsing
+
+
+class LibraryTests(unittest.TestCase):
+    print('Testing math libraries with numeric backends')
+
+    def test_float(self):
+        """Test the default library rounds every operation"""
+        op = Basic()
+        self.assertEqual(0.3333333, op.div(1, 3))
+        self.assertEqual(3.1416, op.pi)
+
+    def test_fraction(self):
+        """Test fractions are exact"""
+        op = Basic(numeric.backend("fraction"))
+        third = op.div(Fraction(1), Fraction(3))
+        self.assertEqual(Fraction(1, 3), third)
+        self.assertEqual(1, op.mul(third, 3))
+
+    def test_decimal(self):
+        """Test decimals are rounded to the context"""
+        op = Advanced(numeric.backend("decimal", context=decimal.Context(prec=10)))
+        self.assertEqual(decimal.Decimal("0.3333333333"), op.div(decimal.Decimal(1), decimal.Decimal(3)))
+        self.assertEqual(decimal.Decimal("1024"), op.power(decimal.Decimal(2), decimal.Decimal(10)))
+        self.assertEqual(decimal.Decimal("3.141592654"), op.pi)
+
+    def test_trigonometry(self):
+        """Test trigonometric functions return numbers of the backend"""
+        op = Advanced(numeric.backend("decimal"))
+        self.assertEqual(decimal.Decimal("0.4794255"), op.sinus(decimal.Decimal("0.5")))
+        self.assertEqual(decimal.Decimal("0.5463025"), op.tang(decimal.Decimal("0.5")))
+        op = Advanced(numeric.backend("fraction"))
+        self.assertEqual(Fraction(4794255, 10000000), op.sinus(Fraction(1, 2)))
+        self.assertIsInstance(op.cotg(Fraction(1, 2)), Fraction)
+
+    def test_unknown(self):
+        """Test unknown backend"""
+        with self.assertRaises(ValueError):
+            numeric.backend("binary")
+        self.assertIs(numeric.FLOAT, numeric.backend("float"))
+
+
+class ParseBackendTests(unittest.TestCase):
+    print('Testing parser with numeric backends')
+
+    def tearDown(self) -> None:
+        cache.disable_cache()
+
+    def test_float(self):
+        """Test intermediate results of floats are rounded"""
+        self.assertEqual("0.9999999", MathParsing().parse("1÷3×3"))
+
+    def test_fraction(self):
+        """Test the result of fractions is rounded only at output"""
+        parser = MathParsing(numeric.backend("fraction"))
+        self.assertEqual("1", parser.parse("1÷3×3"))
+        self.assertEqual("0.1428571", parser.parse("1÷7"))
+        self.assertEqual("3.1415927", parser.parse("π"))
+        self.assertEqual("5.5", parser.parse("5.50"))
+
+    def test_fraction_large(self):
+        """Test large fractions are written exactly without floats"""
+        parser = MathParsing(numeric.backend("fraction"))
+        self.assertEqual(str(2 ** 2000 // 3) + ".3333333", parser.parse("2^2000÷3"))
+        self.assertEqual("1" + "0" * 400 + ".5", parser.parse("10^400+0.5"))
+        self.assertEqual("0.0000001", parser.parse("1÷10^7"))
+        self.assertEqual("0", parser.parse("0-0.00000004"))
+
+    def test_too_long(self):
+        """Test results too long to be written"""
+        for backend in ("fraction", "decimal"):
+            self.assertEqual("Couldn't parse expression", MathParsing(numeric.backend(backend)).parse("2000!"))
+
+    def test_function_overflow(self):
+        """Test functions of numbers too large for floats"""
+        for backend in ("fraction", "decimal"):
+            parser = MathParsing(numeric.backend(backend))
+            self.assertEqual("Couldn't parse expression", parser.parse("-((7!)!)"))
+
+    def test_fraction_exact(self):
+        """Test the exact output of fractions"""
+        parser = MathParsing(numeric.backend("fraction", places=None))
+        self.assertEqual("1/27", parser.parse("(1÷3)^3"))
+        self.assertEqual("3/10", parser.parse("0.1+0.2"))
+
+    def test_decimal(self):
+        """Test decimals with a configured context"""
+        parser = MathParsing(numeric.backend("decimal", context=decimal.Context(prec=40), places=None))
+        self.assertEqual("0.3333333333333333333333333333333333333333", parser.parse("1÷3"))
+        self.assertEqual("-18", parser.parse("3×(2-8)"))
+        self.assertEqual("1.841471", parser.parse("sin(1)+1"))
+
+    def test_decimal_places(self):
+        """Test decimals are rounded to the places of the backend"""
+        parser = MathParsing(numeric.backend("decimal", places=3))
+        self.assertEqual("0.667", parser.parse("2÷3"))
+        self.assertEqual("1", parser.parse("1÷3×3"))
+
+    def test_errors(self):
+        """Test errors of all backends"""
+        for backend in ("fraction", "decimal"):
+            parser = MathParsing(numeric.backend(backend))
+            for expression in ("1÷0", "2^0.5", "0^(-1)", "x", ""):
+                self.assertEqual(MathParsing().parse(expression), parser.parse(expression))
+
+    def test_functions(self):
+        """Test functions of constants and large numbers"""
+        for backend in ("fraction", "decimal"):
+            parser = MathParsing(numeric.backend(backend))
+            self.assertEqual("0", parser.parse("sin(π)"))
+            self.assertEqual("1.442695", parser.parse("log(2)(e)"))
+            self.assertEqual("1.7724539", parser.parse("sqrt(2)(π)"))
+        parser = MathParsing(numeric.backend("decimal"))
+        self.assertEqual("Couldn't parse expression", parser.parse("sin(10^400)"))
+
+    def test_cache(self):
+        """Test results of other backends are not cached"""
+        cache.enable_cache()
+        MathParsing().parse("1÷3×3")
+        self.assertEqual("1", MathParsing(numeric.backend("fraction")).parse("1÷3×3"))
+        self.assertEqual(1, cache.cache_info().size)
+
+
+class DeferredTests(unittest.TestCase):
+    print('Testing deferred rounding of doubles')
+
+    def setUp(self) -> None:
+        self.parser = MathParsing(numeric.backend("double"))
+
+    def test_rounded_once(self):
+        """Test only the final result is rounded"""
+        self.assertEqual("1", self.parser.parse("1÷3×3"))
+        self.assertEqual("0.1428571", self.parser.parse("1÷7"))
+        self.assertEqual("5.5", self.parser.parse("5.50"))
+
+    def test_same_results(self):
+        """Test results which are not affected by rounding of intermediate results"""
+        parser = MathParsing()
+        for expression in ("3×(2-8)", "-(2+3)", "2-3-4", "2^3^2", "(-2)^3", "e^2", "sin(1)+1", "10!",
+                           "log(2)(8)+1", "sqrt(2)(2)", "-sin(0)-1", "((1))"):
+            self.assertEqual(parser.parse(expression), self.parser.parse(expression))
+
+    def test_errors(self):
+        """Test errors are the same as errors of the float backend"""
+        parser = MathParsing()
+        for expression in ("1÷0", "2^0.5", "0^(-1)", "10^400", "200!×2", "1.5!", "(0-3)!", "x", "2+", "",
+                           "sin(10^300×10^300)"):
+            self.assertEqual(parser.parse(expression), self.parser.parse(expression))
+
+    def test_reset(self):
+        """Test the parser is reused after an error"""
+        self.assertEqual("Couldn't parse expression", self.parser.parse("1÷0"))
+        self.assertEqual("2", self.parser.parse("1+1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+@brief file test-service.py with unit tests of the calculator service
+"""
+
+import asyncio
+import unittest
+from calculator.calclib import service
+
+
+class LatencyTests(unittest.TestCase):
+    print('Testing latency percentiles')
+
+    def test_percentiles(self):
+        """Test percentiles of recorded latencies"""
+        recorder = service.LatencyRecorder()
+        for i in range(1, 101):
+            recorder.record(i / 1000)
+        self.assertEqual({'p50': 0.051, 'p90': 0.091, 'p99': 0.1}, recorder.percentiles())
+
+    def test_empty(self):
+        """Test no percentiles without latencies"""
+        self.assertEqual({}, service.LatencyRecorder().percentiles())
+
+
+class ServiceTests(unittest.IsolatedAsyncioTestCase):
+    print('Testing calculator service')
+
+    async def asyncSetUp(self) -> None:
+        self.service = service.CalculatorService(batch_size=8)
+        server = await self.service.start()
+        self.port = server.sockets[0].getsockname()[1]
+        self.client = await service.CalculatorClient().connect(port=self.port)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.service.close()
+
+    async def test_evaluate(self):
+        """Test a single expression"""
+        self.assertEqual('14', await self.client.evaluate('2×(3+4)'))
+        self.assertEqual("Couldn't parse expression", await self.client.evaluate('1÷0'))
+
+    async def test_errors_per_expression(self):
+        """Test a failing expression doesn't fail the other expressions of its batch"""
+        results = await asyncio.gather(self.client.evaluate('1+1'), self.client.evaluate('2000!'),
+                                       self.client.evaluate('3×3'))
+        self.assertEqual(['2', "Couldn't parse expression", '9'], results)
+
+    async def test_pipelined(self):
+        """Test concurrent requests of a connection are answered in order"""
+        exprs = ['{}+{}'.format(i, i) for i in range(100)]
+        results = await asyncio.gather(*(self.client.evaluate(expr) for expr in exprs))
+        self.assertEqual([str(2 * i) for i in range(100)], results)
+
+    async def test_connections(self):
+        """Test requests of many connections"""
+        clients = [await service.CalculatorClient().connect(port=self.port) for _ in range(10)]
+        results = await asyncio.gather(*(client.evaluate('{}×3'.format(i)) for i, client in enumerate(clients)))
+        self.assertEqual([str(3 * i) for i in range(10)], results)
+        for client in clients:
+            await client.close()
+
+    async def test_stats(self):
+        """Test statistics of the service"""
+        await self.client.evaluate('1+1')
+        stats = await self.client.stats()
+        self.assertEqual(1, stats['requests'])
+        self.assertIn('p99', stats['latency'])
+
+    async def test_timeout(self):
+        """Test only the slow expression of a batch times out"""
+        calculator = service.CalculatorService(batch_size=8, batch_delay=0.05, timeout=0.01)
+        server = await calculator.start()
+        client = await service.CalculatorClient().connect(port=server.sockets[0].getsockname()[1])
+        try:
+            results = await asyncio.gather(client.evaluate('100000!'), client.evaluate('1+1'))
+            self.assertEqual(["Couldn't parse expression", '2'], results)
+        finally:
+            await client.close()
+            await calculator.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+@brief file test-stack.py with unit tests of the typed stacks
+"""
+
+import unittest
+from calculator.calclib import stack
+
+
+class NumberStackTests(unittest.TestCase):
+    print('Testing number stack')
+
+    def setUp(self) -> None:
+        self.items = stack.NumberStack(2)
+
+    def test_push_pop(self):
+        """Test numbers are popped in reverse order"""
+        self.items.push(1)
+        self.items.push(2.5)
+        self.assertEqual(2.5, self.items.top())
+        self.assertEqual(2.5, self.items.pop())
+        self.assertEqual(1, self.items.pop())
+        self.assertTrue(self.items.is_empty())
+
+    def test_growth(self):
+        """Test the array grows when it is full"""
+        for i in range(100):
+            self.items.push(i)
+        self.assertEqual(100, self.items.size())
+        self.assertEqual(list(range(99, -1, -1)), [self.items.pop() for _ in range(100)])
+
+    def test_empty(self):
+        """Test pop and top of an empty stack"""
+        with self.assertRaises(IndexError):
+            self.items.pop()
+        with self.assertRaises(IndexError):
+            self.items.top()
+
+    def test_reserve(self):
+        """Test the reserved array can be used by index"""
+        self.items.push(1)
+        numbers = self.items.reserve(10)
+        self.assertEqual(0, len(self.items))
+        self.assertGreaterEqual(len(numbers), 10)
+        numbers[9] = 4.5
+        self.assertEqual(4.5, numbers[9])
+
+    def test_clear(self):
+        """Test clearing of the stack"""
+        self.items.push(1)
+        self.items.clear()
+        self.assertTrue(self.items.is_empty())
+
+
+class OperatorStackTests(unittest.TestCase):
+    print('Testing operator stack')
+
+    def test_codes(self):
+        """Test small integer codes"""
+        codes = stack.OperatorStack()
+        codes.push(3)
+        codes.push(255)
+        self.assertEqual(255, codes.pop())
+        self.assertEqual(3, codes.top())
+
+    def test_wrong_code(self):
+        """Test codes have to fit into a byte"""
+        with self.assertRaises(OverflowError):
+            stack.OperatorStack().push(256)
+
+
+if __name__ == '__main__':
+    unittest.main()
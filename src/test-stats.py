@@ -0,0 +1,143 @@
+"""
+@brief file test-stats.py with unit tests of streaming statistics
+"""
+
+import io
+import os
+import statistics
+import tempfile
+import unittest
+from calculator.calclib import reader, stats
+
+
+class RunningStatsTests(unittest.TestCase):
+    print('Testing running statistics')
+
+    def setUp(self) -> None:
+        self.nums = [331, 718, 681, 981, 419, 644, 838, 126, 712, 281, 0.5, -12]
+
+    def test_mean(self):
+        """Mean of the numbers"""
+        result = stats.RunningStats().update(self.nums)
+        self.assertAlmostEqual(statistics.mean(self.nums), result.mean)
+
+    def test_deviation(self):
+        """Sample standard deviation"""
+        result = stats.RunningStats().update(self.nums)
+        self.assertAlmostEqual(statistics.stdev(self.nums), result.deviation())
+
+    def test_push(self):
+        """Numbers added one by one"""
+        result = stats.RunningStats()
+        for num in self.nums:
+            result.push(num)
+        self.assertAlmostEqual(statistics.variance(self.nums), result.variance())
+
+    def test_merge(self):
+        """Merging of chunks"""
+        result = stats.RunningStats().update(self.nums[:5]).merge(stats.RunningStats().update(self.nums[5:]))
+        self.assertEqual(len(self.nums), result.count)
+        self.assertAlmostEqual(statistics.stdev(self.nums), result.deviation())
+
+    def test_merge_empty(self):
+        """Merging with an empty accumulator"""
+        result = stats.RunningStats().merge(stats.RunningStats().update(self.nums))
+        self.assertAlmostEqual(statistics.stdev(self.nums), result.deviation())
+
+    def test_single_number(self):
+        """Deviation of a single number"""
+        with self.assertRaises(ZeroDivisionError):
+            stats.RunningStats().update([5]).deviation()
+
+
+class ReadNumbersTests(unittest.TestCase):
+    print('Testing reading numbers')
+
+    def test_chunk_boundaries(self):
+        """Numbers split between chunks"""
+        text = "331 718 681\n981 419  644 838 126 712 281"
+        expected = [float(num) for num in text.split()]
+        for chunk_size in (1, 2, 3, 7, 100):
+            self.assertEqual(expected, list(stats.read_numbers(io.StringIO(text), chunk_size)))
+
+    def test_binary_stream(self):
+        """Binary stream"""
+        self.assertEqual([1.0, 22.0, 333.0], list(stats.read_numbers(io.BytesIO(b"1 22 333 "), 2)))
+
+    def test_from_stream(self):
+        """Statistics of a stream"""
+        result = stats.from_stream(io.StringIO("2 4 4 4 5 5 7 9"), 3)
+        self.assertAlmostEqual(5, result.mean)
+        self.assertAlmostEqual(statistics.stdev([2, 4, 4, 4, 5, 5, 7, 9]), result.deviation())
+
+
+class ParallelStatsTests(unittest.TestCase):
+    print('Testing parallel statistics')
+
+    def setUp(self) -> None:
+        self.nums = [(num * 7919) % 1000 for num in range(1000)]
+        file = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        file.write(" ".join(str(num) for num in self.nums))
+        file.close()
+        self.path = file.name
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_ranges(self):
+        """Ranges cover the file and don't split numbers"""
+        ranges = stats.file_ranges(self.path, 7)
+        self.assertEqual(0, ranges[0][0])
+        self.assertEqual(os.path.getsize(self.path), ranges[-1][1])
+        counts = [stats.range_stats(self.path, start, end).count for start, end in ranges]
+        self.assertEqual(len(self.nums), sum(counts))
+
+    def test_more_ranges_than_numbers(self):
+        """Small file split into many ranges"""
+        with open(self.path, "w") as file:
+            file.write("2 4 4 4 5 5 7 9")
+        for start, end in stats.file_ranges(self.path, 32):
+            self.assertLess(start, end)
+        self.assertEqual(8, stats.parallel_stats(self.path, 32).count)
+
+    def test_workers(self):
+        """Same result for different numbers of workers"""
+        for workers in (1, 2, 3):
+            result = stats.parallel_stats(self.path, workers)
+            self.assertEqual(len(self.nums), result.count)
+            self.assertAlmostEqual(statistics.stdev(self.nums), result.deviation())
+
+
+class ReaderTests(unittest.TestCase):
+    print('Testing memory-mapped reader')
+
+    def setUp(self) -> None:
+        file = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        file.write("331 718 681\n981 419  644 838 126 712 -2.5\n")
+        file.close()
+        self.path = file.name
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_map_numbers(self):
+        """All numbers are read"""
+        expected = [331, 718, 681, 981, 419, 644, 838, 126, 712, -2.5]
+        for window in (1, 5, 1 << 20):
+            numbers = reader.map_numbers(self.path, window)
+            self.assertEqual('d', numbers.typecode)
+            self.assertEqual(expected, list(numbers))
+
+    def test_empty_file(self):
+        """Empty file"""
+        open(self.path, "w").close()
+        self.assertEqual(0, len(reader.map_numbers(self.path)))
+
+    @unittest.skipUnless(reader.numpy is not None, 'NumPy is not installed')
+    def test_map_array(self):
+        """NumPy array of the numbers"""
+        self.assertEqual(-2.5, reader.map_array(self.path)[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+@brief file test-tokenizer.py with unit tests of the expression tokenizer
+"""
+
+import unittest
+from calculator.calclib import tokenizer
+from calculator.calclib.exceptions import BadExpressionException
+from calculator.calclib.expressions import MathParsing
+from calculator.calclib.tokenizer import Token
+
+
+class TokenizerTests(unittest.TestCase):
+    print('Testing tokenizer')
+
+    def test_kinds(self):
+        """Test token kinds and positions"""
+        self.assertEqual([Token('number', '12.5', 0), Token('operator', '×', 4), Token('paren', '(', 5),
+                          Token('name', 'x', 6), Token('operator', '+', 7), Token('constant', '3.1416', 8),
+                          Token('paren', ')', 9)],
+                         list(tokenizer.tokenize('12.5×(x+π)')))
+
+    def test_unary_minus(self):
+        """Test unary minus is merged into numbers"""
+        self.assertEqual(['-5', '-', '(', '-2.7183', ')', '-', '(', '-', 'x', ')'],
+                         [token.text for token in tokenizer.tokenize('-5-(-e)-(-x)')])
+
+    def test_unary_minus_position(self):
+        """Test position of negative number is position of the minus"""
+        self.assertEqual(Token('number', '-3', 1), list(tokenizer.tokenize('(-3)'))[1])
+
+    def test_names(self):
+        """Test variable names and constant e"""
+        self.assertEqual([('name', 'rate'), ('operator', '×'), ('constant', '2.7183'), ('operator', '+'),
+                          ('name', 'x2')],
+                         [token[:2] for token in tokenizer.tokenize('rate×e + x2')])
+
+    def test_long_expression(self):
+        """Test long expression is split correctly"""
+        expression = '+'.join('(-{}.5×2)'.format(i) for i in range(20000))
+        tokens = list(tokenizer.tokenize(expression))
+        self.assertEqual(20000 * 6 - 1, len(tokens))
+        self.assertEqual('-19999.5', tokens[-4].text)
+
+
+class ValidationTests(unittest.TestCase):
+    print('Testing validation')
+
+    def assertError(self, expression, message, position):
+        with self.assertRaises(BadExpressionException) as context:
+            list(tokenizer.tokenize(expression))
+        self.assertEqual(position, context.exception.position)
+        self.assertTrue(str(context.exception).startswith(message))
+
+    def test_parentheses(self):
+        """Test unbalanced parentheses"""
+        self.assertError('(1+2))', 'Unbalanced parenthesis', 5)
+        self.assertError('1+((2)', 'Unbalanced parenthesis', 2)
+
+    def test_operators(self):
+        """Test operators next to each other"""
+        self.assertError('5+×3', 'Missing operand', 2)
+        self.assertError('(×3)', 'Missing operand', 1)
+        self.assertError('5+', 'Missing operand', 2)
+        self.assertError('()', 'Missing operand', 1)
+
+    def test_missing_operator(self):
+        """Test operands next to each other"""
+        self.assertError('2π', 'Missing operator', 1)
+        self.assertError('(1)(2)', 'Missing operator', 3)
+
+    def test_numbers(self):
+        """Test number format"""
+        self.assertError('1+1.2.3', 'Wrong number format', 2)
+        self.assertError('1+.5', 'Wrong number format', 2)
+        self.assertError('7×05', 'Leading zero', 2)
+
+    def test_unknown_character(self):
+        """Test unexpected characters"""
+        self.assertError('5$5', 'Unexpected character', 1)
+
+    def test_unary_minus(self):
+        """Test unary minus is allowed only at the start and after a parenthesis"""
+        self.assertEqual(['-', '(', '1', ')'], [token.text for token in tokenizer.tokenize('-(1)')])
+        self.assertError('5×-3', 'Missing operand', 2)
+
+    def test_empty(self):
+        """Test empty expression has no tokens"""
+        self.assertEqual([], list(tokenizer.tokenize('  ')))
+
+    def test_functions(self):
+        """Test function tokens"""
+        self.assertEqual([('function', 'log'), ('paren', '('), ('number', '2'), ('paren', ')'), ('paren', '('),
+                          ('function', 'sin'), ('paren', '('), ('name', 'x'), ('paren', ')'), ('paren', ')'),
+                          ('function', '!')],
+                         [token[:2] for token in tokenizer.tokenize('log(2)(sin(x))!')])
+
+    def test_function_arguments(self):
+        """Test functions without parenthesized arguments"""
+        self.assertError('sin 1', 'Missing parenthesis', 4)
+        self.assertError('log(2)+1', 'Missing parenthesis', 6)
+        self.assertError('sqrt(3)', 'Missing parenthesis', 7)
+        self.assertError('cos(1)(2)', 'Missing operator', 6)
+        self.assertError('2sin(1)', 'Missing operator', 1)
+        self.assertError('(!2)', 'Missing operand', 1)
+
+
+class SplitExpressionTests(unittest.TestCase):
+    print('Testing splitting expressions')
+
+    def setUp(self) -> None:
+        self.op = MathParsing()
+
+    def test_split(self):
+        """Test tokens of MathParsing"""
+        self.op.split_expression('-1-(-4.5×π)')
+        self.assertEqual(['-1', '-', '(', '-4.5', '×', '3.1416', ')'], self.op.tokens)
+
+    def test_check_number_format(self):
+        """Test incorrect numbers"""
+        for expr in ['1.2.3+1', '05+1', '.5+1', '(-.5)']:
+            self.op.tokens = []
+            self.op.split_expression(expr)
+            self.assertFalse(self.op.check_semantics())
+            self.assertIsInstance(self.op.error, BadExpressionException)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+@brief file test-vector.py with unit tests of array math operations
+"""
+
+import unittest
+from array import array
+from calculator.calclib import vector
+from calculator.calclib.advanced import Advanced
+from calculator.calclib.exceptions import BadOperandException
+
+
+class BasicArrayTests(unittest.TestCase):
+    print('Testing basic array operations')
+
+    def setUp(self) -> None:
+        self.op = Advanced()
+        self.xs = [1, 2.5, -3, 0.1, 125.435735]
+        self.ys = [2, 3, 4.7, 1.5, 87.32612747]
+
+    def test_add(self):
+        """Sum of lists"""
+        self.assertEqual([self.op.add(x, y) for x, y in zip(self.xs, self.ys)], list(vector.add(self.xs, self.ys)))
+
+    def test_sub(self):
+        """Difference of array.array and list"""
+        expected = [self.op.sub(x, y) for x, y in zip(self.xs, self.ys)]
+        self.assertEqual(expected, list(vector.sub(array('d', self.xs), self.ys)))
+
+    def test_mul_number(self):
+        """Product with a single number"""
+        self.assertEqual([self.op.mul(x, 3) for x in self.xs], list(vector.mul(self.xs, 3)))
+
+    def test_mul_ties(self):
+        """Products with the 8th decimal place 5 are rounded like Basic"""
+        xs = [-0.1086961, 0.1234567, 0.0000003, -2.5000001, 87.3261275]
+        self.assertEqual([self.op.mul(x, 0.5) for x in xs], list(vector.mul(xs, 0.5)))
+        self.assertEqual([self.op.mul(0.5, x) for x in xs], list(vector.mul([0.5] * len(xs), xs)))
+
+    def test_round_ties(self):
+        """Rounding of many numbers near a tie"""
+        xs = [(i * 2 + 1) / 2e7 + i for i in range(-500, 500)]
+        self.assertEqual([self.op.int_translate(x) for x in xs], list(vector.int_translate(xs)))
+
+    def test_div(self):
+        """Division of lists"""
+        self.assertEqual([self.op.div(x, y) for x, y in zip(self.xs, self.ys)], list(vector.div(self.xs, self.ys)))
+
+    def test_div_zero(self):
+        """Division by zero"""
+        with self.assertRaises(ZeroDivisionError):
+            vector.div([1, 2], [1, 0])
+
+    def test_lengths(self):
+        """Operands of different lengths"""
+        with self.assertRaises(ValueError):
+            vector.add([1, 2], [1])
+
+
+class AdvancedArrayTests(unittest.TestCase):
+    print('Testing advanced array operations')
+
+    def setUp(self) -> None:
+        self.op = Advanced()
+
+    def test_power(self):
+        """Powers with negative bases and exponents"""
+        bases = [5, 2, -4, 6.74, -5]
+        exponents = [2, 10, 3, 4, -2]
+        expected = [self.op.power(x, y) for x, y in zip(bases, exponents)]
+        self.assertEqual(expected, list(vector.power(bases, exponents)))
+
+    def test_rootn(self):
+        """Roots with the same degree"""
+        radicands = [9, 14, -27, 0]
+        self.assertEqual([self.op.rootn(3, x) for x in radicands], list(vector.rootn(3, radicands)))
+
+    def test_rootn_degrees(self):
+        """Roots with different degrees"""
+        self.assertEqual([3, 0.5773503], list(vector.rootn([2, -2], [9, 3])))
+
+    def test_logarithm(self):
+        """Logarithms"""
+        self.assertEqual([3, 3.9068906], list(vector.logarithm([8, 15], [2, 2])))
+
+    def test_logarithm_bad_base(self):
+        """Logarithm with base 1"""
+        with self.assertRaises(BadOperandException):
+            vector.logarithm([8, 15], [2, 1])
+
+    def test_trigonometry(self):
+        """Sines and cosines"""
+        xs = [0, 0.5, 1.5, -3]
+        self.assertEqual([self.op.sinus(x) for x in xs], list(vector.sinus(xs)))
+        self.assertEqual([self.op.cosines(x) for x in xs], list(vector.cosines(xs)))
+
+    def test_sincos(self):
+        """Sines and cosines in a single pass"""
+        xs = [0, 0.5, 1.5708, -3]
+        sines, cosines = vector.sincos(xs)
+        self.assertEqual(list(vector.sinus(xs)), list(sines))
+        self.assertEqual(list(vector.cosines(xs)), list(cosines))
+
+    def test_tangent(self):
+        """Tangents and cotangents"""
+        xs = [0.5, 1, -3]
+        self.assertEqual([self.op.tang(x) for x in xs], list(vector.tangent(xs)))
+        self.assertEqual([self.op.cotg(x) for x in xs], list(vector.cotangent(xs)))
+
+    def test_cotangent_zero(self):
+        """Cotangent of zero"""
+        with self.assertRaises(ZeroDivisionError):
+            vector.cotangent([1, 0])
+
+    def test_factorial(self):
+        """Factorials"""
+        self.assertEqual([1, 6, 3628800], vector.factorial([0, 3, 10]))
+
+    def test_factorial_negative(self):
+        """Factorial of a negative number"""
+        with self.assertRaises(BadOperandException):
+            vector.factorial([3, -5])
+
+    def test_factorial_too_large(self):
+        """Factorial above the largest operand"""
+        with self.assertRaises(BadOperandException):
+            vector.factorial([3, 10 ** 7])
+
+
+if __name__ == '__main__':
+    unittest.main()